@@ -50,8 +50,8 @@ class QueryResultSet:
         self._arrow_table = None  # For Week 2
         self._tokens = tokens  # NEW: Cache for template queries (Week 3)
 
-    def __iter__(self):
-        """Iterate over result bindings (zero-copy)"""
+    def _iter_raw_bindings(self):
+        """Iterate over raw binding dicts (not projected to the requested variables)"""
         # Use cached tokens if available (template queries), otherwise fetch from production
         if self._tokens is not None:
             tokens = self._tokens
@@ -65,10 +65,14 @@ class QueryResultSet:
         else:
             cache_key = self._production.cache_key()
 
+        extract_bindings = self._network.extract_bindings
         for token in tokens:
             # Extract bindings using cache key (fast path via cached field indices)
-            bindings = self._network.extract_bindings(cache_key, token)
+            yield extract_bindings(cache_key, token)
 
+    def __iter__(self):
+        """Iterate over result bindings (zero-copy)"""
+        for bindings in self._iter_raw_bindings():
             # Return only requested variables (if specified)
             if self._variables:
                 yield {v: bindings.get(v, None) for v in self._variables}
@@ -81,7 +85,9 @@ class QueryResultSet:
             return len(self._tokens)
         # For template queries, _production is a string (cache key), not a production object
         if isinstance(self._production, str):
-            # No production object, must count via iteration
+            # No production object, must count via iteration (or an existing table)
+            if self._arrow_table is not None:
+                return self._arrow_table.num_rows
             return sum(1 for _ in self)
         return self._production.get_token_count()
 
@@ -134,6 +140,27 @@ class QueryResultSet:
         """
         return list(self)
 
+    def iter_bindings(self):
+        """
+        Iterate over results as tuples in variable order (no per-row dicts)
+
+        Yields:
+            tuple: One value per variable, in the order of the result's variables.
+                   Without variables, the values of all bindings in binding order.
+
+        Example:
+            results = r.pattern(("?x", "hasAge", "?age"), select=["?x", "?age"])
+            for x, age in results.iter_bindings():
+                print(x, age)
+        """
+        variables = self._variables
+        for bindings in self._iter_raw_bindings():
+            # Return only requested variables (if specified)
+            if variables:
+                yield tuple(map(bindings.get, variables))
+            else:
+                yield tuple(bindings.values())
+
     def to_arrow(self):
         """
         Convert to PyArrow Table (Week 2, Day 6-7: Arrow Integration)
@@ -147,16 +174,24 @@ class QueryResultSet:
         except ImportError:
             raise ImportError("pyarrow is required for to_arrow(). Install with: pip install pyarrow")
 
+        # Results over pre-fetched tokens are a fixed snapshot, so the table built
+        # for them (here or by indexed access) is reused rather than rebuilt
+        if self._tokens is not None and self._arrow_table is not None:
+            return self._arrow_table
+
         # For template queries with cached tokens, build Arrow table from iteration
         if self._tokens is not None or isinstance(self._production, str):
-            # Build Arrow table from Python iteration
-            results = list(self)
-            if not results:
-                # Empty table with correct schema
-                return pa.table({var: [] for var in self._variables})
-            # Convert list of dicts to columnar format
-            columns = {var: [r.get(var) for r in results] for var in self._variables}
-            return pa.table(columns)
+            # Fill columns directly from the bindings instead of materializing
+            # an intermediate list of per-row dicts first
+            columns = {var: [] for var in self._variables}
+            appenders = [(var, columns[var].append) for var in self._variables]
+            for bindings in self:
+                for var, append in appenders:
+                    append(bindings.get(var))
+            table = pa.table(columns)
+            if self._tokens is not None:
+                self._arrow_table = table
+            return table
 
         # Use C++ vectorized to_arrow method for regular queries
         return self._network.query_to_arrow(self._production, self._variables)
@@ -180,8 +215,9 @@ class QueryResultSet:
         # Zero-copy conversion where possible
         df = arrow_table.to_pandas()
 
-        # Ensure columns are in the order of variables (if specified)
-        if self._variables:
+        # Ensure columns are in the order of variables (if specified).
+        # Column selection copies the frame, so only reorder when needed.
+        if self._variables and list(df.columns) != list(self._variables):
             df = df[self._variables]
 
         return df
@@ -328,6 +364,7 @@ class PropertyPathResultSet:
     def _compute_transitive_closure(self):
         """Compute transitive closure using BFS"""
         results = []
+        seen = set()  # frozenset(result.items()) of every result already emitted
 
         # If subject is a variable, get all starting points
         if self._subject.startswith("?"):
@@ -366,7 +403,9 @@ class PropertyPathResultSet:
                         result[self._object_var] = next_node
 
                         # Check if we already have this result
-                        if result not in results:
+                        key = frozenset(result.items())
+                        if key not in seen:
+                            seen.add(key)
                             results.append(result)
 
                     # Add to queue for further exploration
@@ -444,15 +483,19 @@ class LiveQueryResultSet:
         """Number of current results"""
         return self._live_query.size()
 
-    def __iter__(self):
-        """Iterate over current results"""
+    def _iter_raw_bindings(self):
+        """Iterate over raw binding dicts of the current results"""
         tokens = self._live_query.get_results()
         cache_key = self._live_query.cache_key()
 
+        extract_bindings = self._network.extract_bindings
         for token in tokens:
             # Extract bindings from token using cache_key
-            bindings = self._network.extract_bindings(cache_key, token)
+            yield extract_bindings(cache_key, token)
 
+    def __iter__(self):
+        """Iterate over current results"""
+        for bindings in self._iter_raw_bindings():
             # Return only requested variables
             if self._variables:
                 yield {v: bindings.get(v, None) for v in self._variables}
@@ -493,21 +536,22 @@ class LiveQueryResultSet:
         except ImportError:
             raise ImportError("pandas is required for to_pandas()")
 
+        # With known variables, build rows as tuples in column order and skip
+        # the per-row dicts (and the column reordering afterwards)
+        if self._variables:
+            variables = self._variables
+            rows = [tuple(map(bindings.get, variables)) for bindings in self._iter_raw_bindings()]
+            return pd.DataFrame(rows, columns=variables)
+
         # Get current data
         data = self.to_list()
 
-        # If no results, return empty DataFrame with columns
+        # If no results, return empty DataFrame
         if not data:
-            return pd.DataFrame(columns=self._variables if self._variables else [])
+            return pd.DataFrame(columns=[])
 
         # Create DataFrame from list of dicts
-        df = pd.DataFrame(data)
-
-        # Ensure columns are in the order of variables (if specified)
-        if self._variables:
-            df = df[self._variables]
-
-        return df
+        return pd.DataFrame(data)
 
 
 # Re-export MergedQueryResultSet for backward compatibility
@@ -74,6 +74,13 @@ class Reter:
         self.network = owl_rete_cpp.ReteNetwork()
         self.variant = variant
 
+        # query(use_cache=True) and reql(use_cache=True) results. Every method
+        # that changes the network bumps _mutation_count; the fact count is
+        # also checked to catch facts added through self.network directly.
+        self._query_cache = {}
+        self._query_cache_stamp = None
+        self._mutation_count = 0
+
     def load_ontology_file(self, filepath):
         """
         Load and parse DL ontology from file using C++ parser
@@ -100,6 +107,7 @@ class Reter:
         Returns:
             Number of WMEs added
         """
+        self._invalidate_query_cache()
         try:
             # Use C++ parser with optional source tracking and variant
             if source is None:
@@ -140,6 +148,7 @@ class Reter:
                 Felix is a cat.
             ''')
         """
+        self._invalidate_query_cache()
         try:
             # Parse CNL to get facts
             result = owl_rete_cpp.parse_cnl(cnl_text)
@@ -271,6 +280,38 @@ class Reter:
         # Call load_python_code with correct parameters
         return self.load_python_code(python_code, in_file, module_name, None, progress_callback)
 
+    def load_python_files(self, paths, progress_callback=None):
+        """
+        Load several Python source files, in the order given
+
+        Args:
+            paths: Iterable of file paths, or (filepath, module_name) pairs
+            progress_callback: Optional callback function(items_processed, total_items, message)
+
+        Returns:
+            Tuple of (total_wmes, all_errors) where:
+            - total_wmes: Total number of WMEs added from all Python files
+            - all_errors: Dict mapping filepath -> list of errors
+
+        Example:
+            reasoner = Reter()
+            total_wmes, all_errors = reasoner.load_python_files(["a.py", "b.py"])
+        """
+        total_wmes = 0
+        all_errors = {}
+
+        for entry in paths:
+            filepath, module_name = (entry, None) if isinstance(entry, str) else entry
+
+            wmes, errors = self.load_python_file(filepath, module_name, progress_callback)
+            total_wmes += wmes
+
+            # Collect errors for this file
+            if errors:
+                all_errors[filepath] = errors
+
+        return total_wmes, all_errors
+
     def load_python_code(self, python_code, in_file="module.py", module_name=None, source_id=None, progress_callback=None):
         """
         Parse Python source code and extract semantic facts
@@ -325,6 +366,8 @@ class Reter:
 
         facts, errors, registered_methods, unresolved_calls = owl_rete_cpp.parse_python_code(python_code, in_file, module_name)
 
+        self._invalidate_query_cache()
+
         # Use source_id if provided, otherwise fall back to in_file
         actual_source_id = source_id if source_id is not None else in_file
 
@@ -415,8 +458,7 @@ class Reter:
         import os
         import glob
 
-        total_wmes = 0
-        all_errors = {}
+        entries = []
         pattern = "**/*.py" if recursive else "*.py"
 
         for filepath in glob.glob(os.path.join(directory, pattern), recursive=recursive):
@@ -427,15 +469,9 @@ class Reter:
             # Generate module name from relative path
             rel_path = os.path.relpath(filepath, directory)
             module_name = rel_path.replace(os.sep, ".").replace(".py", "")
+            entries.append((filepath, module_name))
 
-            wmes, errors = self.load_python_file(filepath, module_name, progress_callback)
-            total_wmes += wmes
-
-            # Collect errors for this file
-            if errors:
-                all_errors[filepath] = errors
-
-        return total_wmes, all_errors
+        return self.load_python_files(entries, progress_callback=progress_callback)
 
     def load_csharp_code(self, csharp_code, namespace_name="global", progress_callback=None):
         """Parse C# source code and extract semantic facts
@@ -448,6 +484,7 @@ class Reter:
         Returns:
             Number of WMEs added from the C# code
         """
+        self._invalidate_query_cache()
         try:
             from reter_core import owl_rete_cpp
             wme_count = owl_rete_cpp.load_csharp_from_string(
@@ -471,6 +508,7 @@ class Reter:
         Returns:
             Number of WMEs added from the C++ code
         """
+        self._invalidate_query_cache()
         try:
             from reter_core import owl_rete_cpp
             wme_count = owl_rete_cpp.load_cpp_from_string(
@@ -494,6 +532,7 @@ class Reter:
         Returns:
             Number of WMEs added from the JavaScript code
         """
+        self._invalidate_query_cache()
         try:
             from reter_core import owl_rete_cpp
             wme_count = owl_rete_cpp.load_javascript_from_string(
@@ -661,6 +700,7 @@ class Reter:
         Returns:
             Number of WMEs added from the HTML code
         """
+        self._invalidate_query_cache()
         try:
             from reter_core import owl_rete_cpp
             wme_count = owl_rete_cpp.load_html_from_string(
@@ -743,6 +783,7 @@ class Reter:
         # Convert dict to Fact object before passing to C++
         from reter_core import owl_rete_cpp
         fact = owl_rete_cpp.Fact(fact_dict)
+        self._invalidate_query_cache()
 
         # Use source tracking if provided
         if source is None:
@@ -855,6 +896,7 @@ class Reter:
 
         # Create fact and add to network
         fact = owl_rete_cpp.Fact(fact_dict)
+        self._invalidate_query_cache()
         if source is None:
             return self.network.add_fact(fact)
         else:
@@ -907,6 +949,8 @@ class Reter:
                   Each filter is a tuple (builtin_name, arg1, arg2, ...)
                   Example: [("greaterThan", "?age", "18")]
             values: Optional dict mapping variables to allowed values
+                   (any iterable; converted once to a frozenset, so order and
+                   duplicates don't matter)
                    Example: {"?city": ["NYC", "LA", "Chicago"]}
             not_exists: Optional list of patterns that must NOT match
                        Example: [("?x", "hasChild", "?y")]
@@ -943,17 +987,15 @@ class Reter:
             for binding in results:
                 print(binding["?x"], binding["?age"])
         """
+        # VALUES are sets; normalize each list once at the API boundary
+        if values:
+            values = {var: frozenset(vals) for var, vals in values.items()}
+
         # Auto-generate cache key if not provided
         # Use hash() instead of MD5 for much faster cache key generation
         if cache is None:
-            # Create a hashable tuple representation
-            # Convert values dict to hashable format (lists → tuples)
-            hashable_values = None
-            if values:
-                hashable_values = tuple(
-                    (k, tuple(v) if isinstance(v, list) else v)
-                    for k, v in sorted(values.items())
-                )
+            # Create a hashable tuple representation (frozensets hash as-is)
+            hashable_values = tuple(sorted(values.items())) if values else None
 
             cache_tuple = (patterns, tuple(where) if where else None,
                           hashable_values,
@@ -980,7 +1022,7 @@ class Reter:
 
             conditions = []
 
-            for (subj, pred, obj) in patterns:
+            for (subj, pred, obj) in self._order_patterns(patterns, values):
                 # Map triple pattern to WME conditions based on actual fact types
 
                 if pred == "type":
@@ -1018,7 +1060,7 @@ class Reter:
             if values:
                 values_specs = []
                 for var, vals in values.items():
-                    values_specs.append(owl_rete_cpp.ValuesSpec(var, vals))
+                    values_specs.append(owl_rete_cpp.ValuesSpec(var, list(vals)))
                 production = self.network.build_query_pattern_with_values(cache, conditions, values_specs)
             elif where:
                 builtin_filters = [list(filter_spec) for filter_spec in where]
@@ -1047,7 +1089,40 @@ class Reter:
             tokens = self.network.get_query_results(cache)
             return QueryResultSet(cache, return_vars, self.network, tokens=tokens)
 
-    def query(self, type=None, **kwargs):
+    @staticmethod
+    def _order_patterns(patterns, values):
+        """
+        Order triple patterns for joining, most selective first (VALUES queries only)
+
+        A pattern's selectivity is the size of the smallest VALUES list among its
+        variables; ties go to the pattern with more constants. Each next pattern
+        shares a variable with those before it when possible (no cross joins).
+        Without VALUES the caller's order is kept.
+        """
+        if not values or len(patterns) < 2:
+            return patterns
+
+        def pattern_vars(pattern):
+            return {term for term in (pattern[0], pattern[2]) if term.startswith("?")}
+
+        def cost(pattern):
+            sizes = [len(values[v]) for v in pattern_vars(pattern) if v in values]
+            constants = sum(1 for term in (pattern[0], pattern[2]) if not term.startswith("?"))
+            return (min(sizes) if sizes else float("inf"), -constants)
+
+        remaining = sorted(patterns, key=cost)
+        ordered = [remaining.pop(0)]
+        bound = pattern_vars(ordered[0])
+        while remaining:
+            # Cheapest pattern joined to what is already bound (else just the cheapest)
+            index = next((i for i, p in enumerate(remaining) if pattern_vars(p) & bound), 0)
+            pattern = remaining.pop(index)
+            ordered.append(pattern)
+            bound |= pattern_vars(pattern)
+
+        return ordered
+
+    def query(self, type=None, order_by=None, use_cache=False, **kwargs):
         """
         Efficient query method using C++ Arrow-based filtering
 
@@ -1057,6 +1132,11 @@ class Reter:
         Args:
             type: Fact type to query (e.g., 'instance_of', 'role_assertion',
                   'property_domain', 'property_range')
+            order_by: Optional fact key to sort results by (e.g., 'individual').
+                      Facts missing the key sort first.
+            use_cache: If True, reuse the result of an earlier identical query
+                       as long as the network has not changed since. Each call
+                       still gets its own copies of the fact dictionaries.
             **kwargs: Additional filters (e.g., concept='Person', individual='john')
 
         Returns:
@@ -1071,18 +1151,94 @@ class Reter:
 
             # Query property domains
             domains = r.query(type='property_domain', property='hasParent')
+
+            # Instances sorted by individual name
+            facts = r.query(type='instance_of', concept='Person', order_by='individual')
+
+            # Repeated lookup, filtered only once while the data is unchanged
+            facts = r.query(type='instance_of', concept='Person', use_cache=True)
         """
+        cache_key = None
+        if use_cache:
+            try:
+                cache_key = ('query', type, frozenset(kwargs.items()))
+            except TypeError:
+                pass  # Unhashable filter value, don't cache
+
+        if cache_key is not None:
+            cached = self._current_query_cache().get(cache_key)
+            if cached is not None:
+                return self._sort_facts([dict(f) for f in cached], order_by)
+
         # Python-side filtering (safe and reliable)
         # TODO: Optimize with C++ Arrow query when stable
-        all_facts = list(self.network.get_all_facts())
+        facts = self.network.get_all_facts()
 
-        # Filter by type if specified
+        # Attribute filters (role, subject, concept, ...) are far more selective
+        # than the fact type, so apply them first and check type last
+        criteria = list(kwargs.items())
         if type is not None:
-            all_facts = [f for f in all_facts if f.get('type') == type]
+            criteria.append(('type', type))
+
+        if not criteria:
+            all_facts = list(facts)
+        else:
+            # First pass scans every fact; later passes only see the survivors
+            key, value = criteria[0]
+            all_facts = [f for f in facts if f.get(key) == value]
+            for key, value in criteria[1:]:
+                if not all_facts:
+                    break
+                all_facts = [f for f in all_facts if f.get(key) == value]
+
+        if cache_key is not None:
+            self._query_cache[cache_key] = [dict(f) for f in all_facts]
+
+        return self._sort_facts(all_facts, order_by)
 
-        # Filter by additional kwargs
-        for key, value in kwargs.items():
-            all_facts = [f for f in all_facts if f.get(key) == value]
+    def _current_query_cache(self):
+        """Return the query cache, emptied first if the network changed since it was filled"""
+        stamp = (self._mutation_count, self.network.fact_count())
+        if stamp != self._query_cache_stamp:
+            self._query_cache.clear()
+            self._query_cache_stamp = stamp
+        return self._query_cache
+
+    def _invalidate_query_cache(self):
+        """Record a change to the network so cached query results are not reused"""
+        self._mutation_count += 1
+
+    def iter_query(self, type=None, **kwargs):
+        """
+        Lazily yield the facts that query() would return (unsorted)
+
+        Facts are checked one at a time, so callers that stop early (any(),
+        next()) never look at the rest of the fact list.
+
+        Args:
+            type: Fact type to match (e.g., 'subsumption', 'instance_of')
+            **kwargs: Additional filters (e.g., concept='Person', individual='john')
+
+        Yields:
+            Fact dictionaries matching every criterion
+
+        Example:
+            # Does Alice have any concept at all?
+            has_concept = next(r.iter_query(type='instance_of', individual='Alice'), None) is not None
+        """
+        criteria = list(kwargs.items())
+        if type is not None:
+            criteria.append(('type', type))
+
+        for fact in self.network.get_all_facts():
+            if all(fact.get(key) == value for key, value in criteria):
+                yield fact
+
+    @staticmethod
+    def _sort_facts(all_facts, order_by):
+        """Sort a list of facts in place by the order_by key (if given)"""
+        if order_by is not None:
+            all_facts.sort(key=lambda f: f.get(order_by) or "")
 
         return all_facts
 
@@ -1162,7 +1318,7 @@ class Reter:
     # REQL = RETE Query Language (adapted for Description Logic, not RDF)
     # ========================================================================
 
-    def reql(self, query_string, timeout_ms=0):
+    def reql(self, query_string, timeout_ms=0, use_cache=False):
         """
         Execute a REQL query (SELECT, ASK, or DESCRIBE) and return results as Arrow table
 
@@ -1176,6 +1332,9 @@ class Reter:
             query_string: REQL query string (SELECT, ASK, or DESCRIBE syntax)
             timeout_ms: Query timeout in milliseconds. Default 0 means no timeout (infinite).
                        If the query exceeds this timeout, a RuntimeError is raised.
+            use_cache: If True, reuse the result of an earlier identical query string
+                       as long as the network has not changed since (the returned
+                       Arrow table is immutable, so it is safe to share).
 
         Returns:
             pyarrow.Table with query results
@@ -1195,6 +1354,9 @@ class Reter:
             # Query with timeout (5 second limit)
             result = r.reql("SELECT ?x WHERE { ?x type Person }", timeout_ms=5000)
 
+            # Repeated query, parsed and executed only once while the data is unchanged
+            result = r.reql("SELECT ?x WHERE { ?x type Person }", use_cache=True)
+
             # ASK query (checks if pattern exists)
             result = r.reql("ASK WHERE { ?x type Person }")
             exists = result['result'][0].as_py()  # True or False
@@ -1269,7 +1431,16 @@ class Reter:
             import pyarrow.compute as pc
             filtered = pc.filter(result, pc.field('?x') != 'bob')
         """
-        return self.network.reql_query(query_string, timeout_ms)
+        if not use_cache:
+            return self.network.reql_query(query_string, timeout_ms)
+
+        cache = self._current_query_cache()
+        cache_key = ('reql', query_string)
+        result = cache.get(cache_key)
+        if result is None:
+            result = self.network.reql_query(query_string, timeout_ms)
+            cache[cache_key] = result
+        return result
 
     # ========================================================================
     # Description Logic Query Interface
@@ -1794,6 +1965,7 @@ class Reter:
             r = Reter()
             r.load("snapshot.bin")
         """
+        self._invalidate_query_cache()
         return self.network.load(filename)
 
     def load_lazy(self, filename):
@@ -1815,6 +1987,7 @@ class Reter:
             df = r.query("SELECT ?s ?p ?o")    # Query works immediately
             r.materialize()                     # Convert to eager if needed
         """
+        self._invalidate_query_cache()
         return self.network.load_lazy(filename)
 
     def is_lazy(self):
@@ -1833,6 +2006,7 @@ class Reter:
         Copies all data from the memory-mapped file to internal storage.
         Required before rule execution or RETE operations that modify the network.
         """
+        self._invalidate_query_cache()
         self.network.materialize()
 
     def remove_source(self, source_id):
@@ -1846,6 +2020,7 @@ class Reter:
             r.load_ontology("...", source="ontology1")
             r.remove_source("ontology1")  # Removes ontology1 and derived facts
         """
+        self._invalidate_query_cache()
         self.network.remove_source(source_id)
 
     def get_all_sources(self):
@@ -1898,16 +2073,28 @@ class Reter:
         Args:
             filepath: Output file path
             format: 'human' or 'json'
+                    JSON export uses orjson when installed, falling back to json;
+                    both write non-ASCII text as UTF-8, not \\u escapes
         """
+        # get_all_facts() returns an Arrow table; convert to row dicts once
+        facts_data = self.get_all_facts().to_pylist()
+
         with open(filepath, 'w', encoding='utf-8') as f:
             if format == 'human':
-                for fact in self.get_all_facts():
-                    inferred = " [INFERRED]" if fact.get('inferred') == 'true' else ""
-                    f.write(f"{fact}{inferred}\n")
+                f.writelines(
+                    f"{fact}{' [INFERRED]' if fact.get('inferred') == 'true' else ''}\n"
+                    for fact in facts_data
+                )
             elif format == 'json':
-                import json
-                facts_data = self.get_all_facts()
-                json.dump(facts_data, f, indent=2)
+                try:
+                    import orjson
+                except ImportError:
+                    import json
+                    # ensure_ascii=False matches orjson, which never escapes
+                    json.dump(facts_data, f, indent=2, ensure_ascii=False)
+                else:
+                    # Single-shot encode straight to UTF-8 bytes
+                    f.write(orjson.dumps(facts_data, option=orjson.OPT_INDENT_2).decode('utf-8'))
 
 
 def main():
@@ -234,5 +234,46 @@ def create_car(name):
     assert inheritance.num_rows >= 1  # Car inherits from Vehicle
 
 
+def test_load_python_files_matches_individual_loads(sample_python_directory):
+    """
+    load_python_files adds the same WMEs as loading each file on its own
+    """
+    main_path = os.path.join(sample_python_directory, "main.py")
+    utils_path = os.path.join(sample_python_directory, "subpackage", "utils.py")
+
+    single = Reter(variant='ai')
+    expected = (
+        single.load_python_file(main_path)[0]
+        + single.load_python_file(utils_path, "subpackage.utils")[0]
+    )
+
+    batch = Reter(variant='ai')
+    wme_count, errors = batch.load_python_files([main_path, (utils_path, "subpackage.utils")])
+
+    assert wme_count == expected
+    assert errors == {}
+    assert batch.network.fact_count() == single.network.fact_count()
+
+
+def test_load_python_files_reports_progress(reter_instance, sample_python_directory):
+    """
+    load_python_files passes progress_callback through, finishing each file once
+    """
+    main_path = os.path.join(sample_python_directory, "main.py")
+    utils_path = os.path.join(sample_python_directory, "subpackage", "utils.py")
+
+    calls = []
+    reter_instance.load_python_files(
+        [main_path, utils_path],
+        progress_callback=lambda processed, total, msg: calls.append((processed, total, msg))
+    )
+
+    completed = [msg for processed, total, msg in calls if msg.startswith("Completed")]
+    assert len(completed) == 2
+    assert completed[0].startswith(f"Completed {main_path.replace(os.sep, '/')}:")
+    assert completed[1].startswith(f"Completed {utils_path.replace(os.sep, '/')}:")
+    assert all(processed <= total for processed, total, _ in calls)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
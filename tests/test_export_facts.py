@@ -0,0 +1,70 @@
+"""
+Test Reter.export_facts() round trips, including non-ASCII identifiers
+"""
+import ast
+import json
+import sys
+
+import pytest
+
+from reter import Reter
+
+ONTOLOGY = """
+    Person（José）
+    Person（mary）
+"""
+
+INFERRED_SUFFIX = " [INFERRED]"
+
+
+@pytest.fixture
+def reasoner():
+    r = Reter()
+    r.load_ontology(ONTOLOGY)
+    return r
+
+
+def _export_json(reasoner, path, use_orjson):
+    """Export as JSON through either the orjson or the json fallback path"""
+    with pytest.MonkeyPatch.context() as mp:
+        if not use_orjson:
+            # A None entry makes "import orjson" raise ImportError
+            mp.setitem(sys.modules, "orjson", None)
+        reasoner.export_facts(str(path), format='json')
+    return path.read_text(encoding='utf-8')
+
+
+@pytest.mark.parametrize("use_orjson", [False, True], ids=["json", "orjson"])
+def test_export_json_round_trip(reasoner, tmp_path, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+
+    text = _export_json(reasoner, tmp_path / "facts.json", use_orjson)
+
+    assert json.loads(text) == reasoner.get_all_facts().to_pylist()
+    # Non-ASCII is written as UTF-8, not as \u escapes
+    assert "José" in text
+    assert "\\u00e9" not in text
+
+
+def test_export_json_paths_match(reasoner, tmp_path):
+    pytest.importorskip("orjson")
+
+    with_json = _export_json(reasoner, tmp_path / "json.json", False)
+    with_orjson = _export_json(reasoner, tmp_path / "orjson.json", True)
+
+    assert with_json == with_orjson
+
+
+def test_export_human_round_trip(reasoner, tmp_path):
+    path = tmp_path / "facts.txt"
+    reasoner.export_facts(str(path), format='human')
+
+    facts = []
+    for line in path.read_text(encoding='utf-8').splitlines():
+        if line.endswith(INFERRED_SUFFIX):
+            line = line[:-len(INFERRED_SUFFIX)]
+        facts.append(ast.literal_eval(line))
+
+    assert facts == reasoner.get_all_facts().to_pylist()
+    assert any(f.get('individual') == "José" for f in facts)
@@ -5,7 +5,7 @@ Week 1, Day 5-7 of IMPLEMENTATION_PLAN.md
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'rete_cpp'))
-from reter import Reter
+from reter import Reter, QueryResultSet
 
 
 def test_pattern_basic():
@@ -117,6 +117,41 @@ def test_select_variables():
     print(f"✓ Variable selection works: {binding}")
 
 
+class FakeBindingNetwork:
+    """Stands in for ReteNetwork: each token is already its bindings dict"""
+
+    def extract_bindings(self, cache_key, token):
+        return token
+
+
+def test_iter_bindings_with_variables():
+    """Test iter_bindings yields tuples in select order"""
+    r = Reter()
+    r.load_ontology("""
+        Person（john）
+        hasAge（john，30）
+    """)
+
+    results = r.pattern(
+        ("?x", "type", "Person"),
+        ("?x", "hasAge", "?age"),
+        select=["?age", "?x"]
+    )
+
+    assert list(results.iter_bindings()) == [("30", "john")]
+    print("✓ iter_bindings() yields tuples in select order")
+
+
+def test_iter_bindings_without_variables():
+    """Test iter_bindings without variables yields every binding, like iteration does"""
+    tokens = [{"?x": "john", "?age": "30"}, {"?x": "mary", "?age": "25"}]
+    results = QueryResultSet("key", None, FakeBindingNetwork(), tokens=tokens)
+
+    assert list(results) == tokens
+    assert list(results.iter_bindings()) == [("john", "30"), ("mary", "25")]
+    print("✓ iter_bindings() works without variables")
+
+
 if __name__ == "__main__":
     print("Testing Python Pattern API...")
     print("=" * 50)
@@ -136,6 +171,12 @@ if __name__ == "__main__":
     test_select_variables()
     print()
 
+    test_iter_bindings_with_variables()
+    print()
+
+    test_iter_bindings_without_variables()
+    print()
+
     print("=" * 50)
     print("\nAll Day 5-7 tests passed!")
     print("Next: Week 2 - Arrow Integration + Filters")
@@ -0,0 +1,143 @@
+"""
+Test result caching in Reter.query(use_cache=True) and Reter.reql(use_cache=True)
+"""
+from reter import Reter
+
+
+class CountingNetwork:
+    """Wraps a ReteNetwork and counts get_all_facts() and reql_query() calls"""
+
+    def __init__(self, network):
+        self._network = network
+        self.get_all_facts_calls = 0
+        self.reql_query_calls = 0
+
+    def get_all_facts(self):
+        self.get_all_facts_calls += 1
+        return self._network.get_all_facts()
+
+    def reql_query(self, query_string, timeout_ms):
+        self.reql_query_calls += 1
+        return self._network.reql_query(query_string, timeout_ms)
+
+    def __getattr__(self, name):
+        return getattr(self._network, name)
+
+
+def make_reasoner(ontology):
+    r = Reter()
+    r.load_ontology(ontology)
+    r.network = CountingNetwork(r.network)
+    return r
+
+
+def person_names(facts):
+    return {f["individual"] for f in facts}
+
+
+def test_query_cache_hit():
+    """A repeated query on an unchanged network is answered from the cache"""
+    r = make_reasoner("Person（john）\nPerson（mary）")
+
+    first = r.query(type='instance_of', concept='Person', use_cache=True)
+    second = r.query(type='instance_of', concept='Person', use_cache=True)
+
+    assert person_names(first) == person_names(second) == {"john", "mary"}
+    assert r.network.get_all_facts_calls == 1
+
+
+def test_query_cache_is_opt_in():
+    """Without use_cache every call filters the network again"""
+    r = make_reasoner("Person（john）")
+
+    r.query(type='instance_of', concept='Person')
+    r.query(type='instance_of', concept='Person')
+
+    assert r.network.get_all_facts_calls == 2
+
+
+def test_query_cache_miss_after_add_triple():
+    r = make_reasoner("Person（john）")
+
+    assert person_names(r.query(type='instance_of', concept='Person', use_cache=True)) == {"john"}
+    r.add_triple("mary", "type", "Person")
+
+    assert person_names(r.query(type='instance_of', concept='Person', use_cache=True)) == {"john", "mary"}
+    assert r.network.get_all_facts_calls == 2
+
+
+def test_query_cache_miss_after_load_ontology():
+    r = make_reasoner("Person（john）")
+
+    assert person_names(r.query(type='instance_of', concept='Person', use_cache=True)) == {"john"}
+    r.load_ontology("Person（mary）")
+
+    assert person_names(r.query(type='instance_of', concept='Person', use_cache=True)) == {"john", "mary"}
+
+
+def test_query_cache_miss_when_fact_count_unchanged():
+    """Replacing one source by another of the same size still invalidates the cache"""
+    r = Reter()
+    r.load_ontology("Person（john）", source="a")
+
+    assert person_names(r.query(type='instance_of', concept='Person', use_cache=True)) == {"john"}
+    r.remove_source("a")
+    r.load_ontology("Person（mary）", source="b")
+
+    assert person_names(r.query(type='instance_of', concept='Person', use_cache=True)) == {"mary"}
+
+
+def test_query_cache_result_modified_by_caller():
+    """Changing a returned fact or list does not affect later cached results"""
+    r = make_reasoner("Person（john）")
+
+    first = r.query(type='instance_of', concept='Person', use_cache=True)
+    first[0]["individual"] = "changed"
+    first.append({"individual": "extra"})
+
+    second = r.query(type='instance_of', concept='Person', use_cache=True)
+    assert person_names(second) == {"john"}
+    assert r.network.get_all_facts_calls == 1
+
+
+PERSON_QUERY = "SELECT ?x WHERE { ?x type Person }"
+
+
+def test_reql_cache_hit_returns_same_table():
+    """A repeated reql(use_cache=True) returns the very same Arrow table"""
+    r = make_reasoner("Person（john）\nPerson（mary）")
+
+    first = r.reql(PERSON_QUERY, use_cache=True)
+    second = r.reql(PERSON_QUERY, use_cache=True)
+
+    assert second is first
+    assert set(first.column("?x").to_pylist()) == {"john", "mary"}
+    assert r.network.reql_query_calls == 1
+
+
+def test_reql_cache_is_opt_in():
+    r = make_reasoner("Person（john）")
+
+    first = r.reql(PERSON_QUERY)
+    second = r.reql(PERSON_QUERY)
+
+    assert second is not first
+    assert r.network.reql_query_calls == 2
+
+
+def test_reql_cache_miss_after_new_facts():
+    r = make_reasoner("Person（john）")
+
+    first = r.reql(PERSON_QUERY, use_cache=True)
+    r.add_triple("mary", "type", "Person")
+    second = r.reql(PERSON_QUERY, use_cache=True)
+
+    assert second is not first
+    assert set(second.column("?x").to_pylist()) == {"john", "mary"}
+    assert r.network.reql_query_calls == 2
+
+    r.load_ontology("Person（bob）")
+    third = r.reql(PERSON_QUERY, use_cache=True)
+
+    assert set(third.column("?x").to_pylist()) == {"john", "mary", "bob"}
+    assert r.network.reql_query_calls == 3
@@ -4,7 +4,6 @@ Quick SWRL test - smaller set to verify no infinite loops
 """
 
 import sys
-sys.path.insert(0, '.')
 from reter import Reter
 
 def test_basic_swrl():
@@ -2,9 +2,6 @@
 Test symmetric property via role equivalence: knows ≣ knows⁻
 This is different from: knows ≣ knows⁻ (property equivalence)
 """
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from reter import Reter
 
 def test_role_equivalence_symmetric():
@@ -29,11 +26,16 @@ def test_role_equivalence_symmetric():
     # Check all facts
     all_facts = reasoner.query()
     print(f"\nTotal facts: {len(all_facts)}")
+    # Buffer the per-fact lines and emit them with a single write
+    lines = []
     for fact in all_facts:
-        if 'symmetric' in str(fact.get('type', '')):
-            print(f"  SYMMETRIC: {fact}")
-        if fact.get('type') == 'equivalent_property':
-            print(f"  EQUIV_PROP: {fact}")
+        fact_type = str(fact.get('type', ''))
+        if 'symmetric' in fact_type:
+            lines.append(f"  SYMMETRIC: {fact}")
+        if fact_type == 'equivalent_property':
+            lines.append(f"  EQUIV_PROP: {fact}")
+    if lines:
+        print("\n".join(lines))
     
     # Check that Bob knows Alice is inferred
     facts = reasoner.query(
@@ -44,8 +46,8 @@ def test_role_equivalence_symmetric():
     )
     
     print(f"\nInferred facts for Bob knows Alice: {len(facts)}")
-    for fact in facts:
-        print(f"  - {fact}")
+    if facts:
+        print("\n".join(f"  - {fact}" for fact in facts))
     
     if len(facts) > 0:
         print("✓ Test passed: R ≣ R⁻ works for symmetric")
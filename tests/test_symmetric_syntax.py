@@ -1,9 +1,6 @@
 """
 Test if symmetric properties can be expressed as R ≣ R⁻
 """
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from reter import Reter
 
 def test_symmetric_via_inverse_equivalence():
@@ -6,14 +6,31 @@ Expected performance: ~1μs for cached queries.
 """
 
 import sys
-import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(__file__))
+import pytest
 
 from reter import Reter
 
 
+PEOPLE_ONTOLOGY = """
+    Person（john）
+    Person（mary）
+"""
+
+
+def _build_people_reter():
+    """Build the shared two-person reasoner used by read-only template tests"""
+    r = Reter()
+    r.load_ontology(PEOPLE_ONTOLOGY)
+    return r
+
+
+@pytest.fixture(scope="module")
+def people_reter():
+    """Two-person reasoner built once per module (tests only read from it)"""
+    return _build_people_reter()
+
+
 def test_instances_of_basic():
     """Test basic instances_of template query"""
     print("\n=== Test 1: instances_of basic ===")
@@ -44,17 +61,11 @@ def test_instances_of_basic():
     print("✓ instances_of basic test passed")
 
 
-def test_instances_of_iteration():
+def test_instances_of_iteration(people_reter):
     """Test iteration over instances_of results"""
     print("\n=== Test 2: instances_of iteration ===")
 
-    r = Reter()
-    r.load_ontology("""
-        Person（john）
-        Person（mary）
-    """)
-
-    people = r.instances_of("Person")
+    people = people_reter.instances_of("Person")
 
     # Test __iter__
     count = 0
@@ -130,22 +141,15 @@ def test_instances_with_property():
     print("✓ instances_with_property test passed")
 
 
-def test_related():
+def test_related(people_reter):
     """Test related template query for object properties"""
     print("\n=== Test 5: related ===")
 
-    r = Reter()
-
-    # Load ontology with object property assertions
     # Note: This requires role_assertion facts to be created
     # For now, we'll test the API structure even if no results
-    r.load_ontology("""
-        Person（john）
-        Person（mary）
-    """)
 
     # Query related objects (may return empty if no role_assertions exist)
-    related_results = r.related("john", "hasParent")
+    related_results = people_reter.related("john", "hasParent")
 
     results = related_results.to_list()
     print(f"Found {len(results)} parent relations for john")
@@ -156,18 +160,12 @@ def test_related():
     print("✓ related test passed (API structure verified)")
 
 
-def test_all_property_assertions():
+def test_all_property_assertions(people_reter):
     """Test all_property_assertions template query"""
     print("\n=== Test 6: all_property_assertions ===")
 
-    r = Reter()
-    r.load_ontology("""
-        Person（john）
-        Person（mary）
-    """)
-
     # Query all assertions of a property (may be empty if no role_assertions)
-    results_set = r.all_property_assertions("hasParent")
+    results_set = people_reter.all_property_assertions("hasParent")
     results = results_set.to_list()
 
     print(f"Found {len(results)} hasParent assertions")
@@ -182,11 +180,9 @@ def test_template_query_caching():
     """Test that template queries use caching"""
     print("\n=== Test 7: template query caching ===")
 
+    # Fresh reasoner, so the first call really compiles the production
     r = Reter()
-    r.load_ontology("""
-        Person（john）
-        Person（mary）
-    """)
+    r.load_ontology(PEOPLE_ONTOLOGY)
 
     # First call - compiles production
     results1 = r.instances_of("Person")
@@ -280,24 +276,27 @@ def run_all_tests():
     print("Template Query API Test Suite (Week 3, Day 3-5)")
     print("=" * 60)
 
+    # Shared reasoner for the read-only tests that take the people_reter fixture
+    people_reter = _build_people_reter()
+
     tests = [
-        test_instances_of_basic,
-        test_instances_of_iteration,
-        test_property_value,
-        test_instances_with_property,
-        test_related,
-        test_all_property_assertions,
-        test_template_query_caching,
-        test_pandas_conversion,
-        test_empty_results,
+        (test_instances_of_basic, ()),
+        (test_instances_of_iteration, (people_reter,)),
+        (test_property_value, ()),
+        (test_instances_with_property, ()),
+        (test_related, (people_reter,)),
+        (test_all_property_assertions, (people_reter,)),
+        (test_template_query_caching, ()),
+        (test_pandas_conversion, ()),
+        (test_empty_results, ()),
     ]
 
     passed = 0
     failed = 0
 
-    for test in tests:
+    for test, args in tests:
         try:
-            test()
+            test(*args)
             passed += 1
         except Exception as e:
             print(f"✗ Test {test.__name__} FAILED: {e}")
@@ -4,8 +4,6 @@ Test the template rule system by demonstrating symmetric property template.
 """
 
 import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from reter_core import owl_rete_cpp
 
 def test_symmetric_property_template():
@@ -4,9 +4,9 @@ Minimal test case extracted from transformer.py to reproduce the parsing bug.
 """
 
 import unittest
-import tempfile
 import os
 import sys
+from collections import Counter
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -125,80 +125,74 @@ class RenderChartStep:
 class TestTransformerExtract(unittest.TestCase):
     """Test parsing of extracted transformer.py code."""
 
+    # Expected __init__ parameter counts (excluding self)
+    EXPECTED_INIT_PARAMS = {
+        "NestStep": 5,  # parent, child, root, max_depth, children_key
+        "RenderTableStep": 7,  # format, columns, title, totals, sort, group_by, max_rows
+        "RenderChartStep": 9,  # chart_type, x, y, series, title, format, colors, stacked, horizontal
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """Parse TRANSFORMER_EXTRACT and run the queries once; tests only read the results."""
+        cls.reasoner = Reter()
+        cls.wme_count, cls.errors = cls.reasoner.load_python_code(
+            TRANSFORMER_EXTRACT, "transformer_extract.py"
+        )
+
+        cls.classes = cls.reasoner.pattern(
+            ("?x", "type", "py:Class"),
+            ("?x", "name", "?name"),
+            ("?x", "qualifiedName", "?qname")
+        ).to_list()
+
+        # One query over all classes' __init__ parameters, grouped in Python,
+        # instead of one query per class
+        params = cls.reasoner.pattern(
+            ("?class", "type", "py:Class"),
+            ("?class", "name", "?class_name"),
+            ("?class", "hasMethod", "?method"),
+            ("?method", "name", "__init__"),
+            ("?method", "hasParameter", "?param"),
+            ("?param", "name", "?param_name"),
+            select=["?class_name", "?param_name"]
+        )
+        cls.params_by_class = Counter(
+            class_name for class_name, param_name in params.iter_bindings()
+            if param_name != "self"
+        )
+
     def test_three_classes_parsed_correctly(self):
         """Test that all three classes are parsed as separate top-level classes."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, newline='\n') as f:
-            f.write(TRANSFORMER_EXTRACT)
-            temp_path = f.name
-
-        try:
-            reasoner = Reter()
-            wme_count, errors = reasoner.load_python_file(temp_path)
-
-            classes = reasoner.pattern(
-                ("?x", "type", "py:Class"),
-                ("?x", "name", "?name"),
-                ("?x", "qualifiedName", "?qname")
-            ).to_list()
-
-            class_names = {c["?name"] for c in classes}
-
-            # Should have exactly 3 classes
+        class_names = {c["?name"] for c in self.classes}
+
+        # Should have exactly 3 classes
+        self.assertEqual(
+            class_names,
+            {"NestStep", "RenderTableStep", "RenderChartStep"},
+            f"Expected 3 classes, got: {class_names}"
+        )
+
+        # None should be nested
+        for c in self.classes:
+            parts = c["?qname"].split(".")
+            # The qualified name should be module.ClassName, not module.Class.NestedClass
             self.assertEqual(
-                class_names,
-                {"NestStep", "RenderTableStep", "RenderChartStep"},
-                f"Expected 3 classes, got: {class_names}"
+                len(parts),
+                2,  # module.ClassName
+                f"{c['?name']} should not be nested, got qname: {c['?qname']}"
             )
 
-            # None should be nested
-            for c in classes:
-                parts = c["?qname"].split(".")
-                # The qualified name should be module.ClassName, not module.Class.NestedClass
-                self.assertEqual(
-                    len(parts),
-                    2,  # module.ClassName
-                    f"{c['?name']} should not be nested, got qname: {c['?qname']}"
-                )
-        finally:
-            os.unlink(temp_path)
-
     def test_init_parameters_not_accumulated(self):
         """Test that __init__ parameters are not accumulated across classes."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, newline='\n') as f:
-            f.write(TRANSFORMER_EXTRACT)
-            temp_path = f.name
-
-        try:
-            reasoner = Reter()
-            wme_count, errors = reasoner.load_python_file(temp_path)
-
-            # Check each class's __init__ parameter count
-            expected = {
-                "NestStep": 5,  # parent, child, root, max_depth, children_key
-                "RenderTableStep": 7,  # format, columns, title, totals, sort, group_by, max_rows
-                "RenderChartStep": 9,  # chart_type, x, y, series, title, format, colors, stacked, horizontal
-            }
-
-            for class_name, expected_count in expected.items():
-                params = reasoner.pattern(
-                    ("?class", "type", "py:Class"),
-                    ("?class", "name", class_name),
-                    ("?class", "hasMethod", "?method"),
-                    ("?method", "name", "__init__"),
-                    ("?method", "hasParameter", "?param"),
-                    ("?param", "name", "?param_name")
-                ).to_list()
-
-                param_names = [p["?param_name"] for p in params if p["?param_name"] != "self"]
-
-                self.assertEqual(
-                    len(param_names),
-                    expected_count,
-                    f"{class_name}.__init__ should have {expected_count} params, "
-                    f"got {len(param_names)}: {param_names}"
-                )
-        finally:
-            os.unlink(temp_path)
+        for class_name, expected_count in self.EXPECTED_INIT_PARAMS.items():
+            count = self.params_by_class[class_name]
+            self.assertEqual(
+                count,
+                expected_count,
+                f"{class_name}.__init__ should have {expected_count} params, "
+                f"got {count}"
+            )
 
 
 if __name__ == "__main__":
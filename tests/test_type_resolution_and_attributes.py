@@ -11,17 +11,9 @@ Tests the new features added to PythonFactExtractionVisitor:
 
 import pytest
 from reter import Reter
-import tempfile
-import os
 
 
-@pytest.fixture
-def reter_instance():
-    """Create a fresh Reter instance for each test."""
-    return Reter()
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_code_with_attributes():
     """Sample Python code with various class attributes."""
     return '''
@@ -80,7 +72,7 @@ class SecretManager:
 '''
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_code_with_method_calls():
     """Sample Python code with method calls to test resolution."""
     return '''
@@ -127,308 +119,178 @@ class ConfigManager:
 '''
 
 
+def _load_sample(sample_code):
+    """Load sample code into a new Reter straight from memory (no temp file)."""
+    reter = Reter()
+    reter.load_python_code(sample_code, "test_module.py")
+    return reter
+
+
+@pytest.fixture(scope="module")
+def loaded_reter_attrs(sample_code_with_attributes):
+    """Reter with the attributes sample parsed once per module (tests only read)."""
+    return _load_sample(sample_code_with_attributes)
+
+
+@pytest.fixture(scope="module")
+def loaded_reter_calls(sample_code_with_method_calls):
+    """Reter with the method-calls sample parsed once per module (tests only read)."""
+    return _load_sample(sample_code_with_method_calls)
+
+
+@pytest.fixture(scope="module")
+def attribute_names_by_visibility(loaded_reter_attrs):
+    """Attribute names grouped by visibility, from a single query per module."""
+    result = loaded_reter_attrs.reql("""
+        SELECT ?name ?visibility
+        WHERE {
+            ?attr concept "py:Attribute" .
+            ?attr name ?name .
+            ?attr visibility ?visibility
+        }
+    """)
+
+    names_by_visibility = {}
+    for name, visibility in zip(result.column('?name').to_pylist(),
+                                result.column('?visibility').to_pylist()):
+        names_by_visibility.setdefault(visibility, set()).add(name)
+    return names_by_visibility
+
+
 class TestClassAttributeDetection:
     """Test detection of class attributes and their properties."""
 
-    def test_public_attributes_detected(self, reter_instance, sample_code_with_attributes):
+    def test_public_attributes_detected(self, attribute_names_by_visibility):
         """Test that public attributes are correctly detected."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(sample_code_with_attributes)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            reter_instance.load_python_file(temp_path)
-
-            # Query for public attributes using REQL
-            result = reter_instance.reql("""
-                SELECT ?attr
-                WHERE {
-                    ?attr concept "py:Attribute" .
-                    ?attr name "plugins" .
-                    ?attr visibility "public"
-                }
-            """)
-
-            assert result.num_rows > 0, "Public attribute 'plugins' should be detected"
-
-            # Check plugin_loader attribute
-            result = reter_instance.reql("""
-                SELECT ?attr
-                WHERE {
-                    ?attr concept "py:Attribute" .
-                    ?attr name "plugin_loader" .
-                    ?attr visibility "public"
-                }
-            """)
-
-            assert result.num_rows > 0, "Public attribute 'plugin_loader' should be detected"
-
-        finally:
-            os.unlink(temp_path)
-
-    def test_protected_attributes_detected(self, reter_instance, sample_code_with_attributes):
+        names = attribute_names_by_visibility.get("public", set())
+
+        assert "plugins" in names, "Public attribute 'plugins' should be detected"
+        assert "plugin_loader" in names, "Public attribute 'plugin_loader' should be detected"
+
+    def test_protected_attributes_detected(self, attribute_names_by_visibility):
         """Test that protected attributes (single underscore) are correctly detected."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(sample_code_with_attributes)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            reter_instance.load_python_file(temp_path)
-
-            # Query for protected attributes using REQL
-            result = reter_instance.reql("""
-                SELECT ?attr
-                WHERE {
-                    ?attr concept "py:Attribute" .
-                    ?attr name "_internal_state" .
-                    ?attr visibility "protected"
-                }
-            """)
-
-            assert result.num_rows > 0, "Protected attribute '_internal_state' should be detected"
-
-            # Check _cache attribute
-            result = reter_instance.reql("""
-                SELECT ?attr
-                WHERE {
-                    ?attr concept "py:Attribute" .
-                    ?attr name "_cache" .
-                    ?attr visibility "protected"
-                }
-            """)
-
-            assert result.num_rows > 0, "Protected attribute '_cache' should be detected"
-
-        finally:
-            os.unlink(temp_path)
-
-    def test_private_attributes_detected(self, reter_instance, sample_code_with_attributes):
-        """Test that private attributes (double underscore) are correctly detected."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(sample_code_with_attributes)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            reter_instance.load_python_file(temp_path)
-
-            # Query for private attributes using REQL
-            result = reter_instance.reql("""
-                SELECT ?attr
-                WHERE {
-                    ?attr concept "py:Attribute" .
-                    ?attr name "__secret_key" .
-                    ?attr visibility "private"
-                }
-            """)
-
-            assert result.num_rows > 0, "Private attribute '__secret_key' should be detected"
-
-            # Check __config attribute
-            result = reter_instance.reql("""
-                SELECT ?attr
-                WHERE {
-                    ?attr concept "py:Attribute" .
-                    ?attr name "__config" .
-                    ?attr visibility "private"
-                }
-            """)
-
-            assert result.num_rows > 0, "Private attribute '__config' should be detected"
-
-        finally:
-            os.unlink(temp_path)
-
-    def test_attribute_types_detected(self, reter_instance, sample_code_with_attributes):
-        """Test that attribute types are correctly inferred from constructor calls."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(sample_code_with_attributes)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            reter_instance.load_python_file(temp_path)
-
-            # Query for attribute with specific type using REQL
-            result = reter_instance.reql("""
-                SELECT ?attr ?type
-                WHERE {
-                    ?attr concept "py:Attribute" .
-                    ?attr name "plugin_loader" .
-                    ?attr hasType ?type
-                }
-            """)
-
-            assert result.num_rows > 0, "Attribute 'plugin_loader' should have type"
-
-            # Verify the type is correct (should be PluginLoader from same module)
-            if result.num_rows > 0:
-                type_value = result.column('?type')[0].as_py()
-                assert "PluginLoader" in type_value, f"Expected PluginLoader type, got {type_value}"
-
-        finally:
-            os.unlink(temp_path)
-
-    def test_attributes_have_class_association(self, reter_instance, sample_code_with_attributes):
-        """Test that attributes are associated with their parent class."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(sample_code_with_attributes)
-            f.flush()
-            temp_path = f.name
+        names = attribute_names_by_visibility.get("protected", set())
 
-        try:
-            reter_instance.load_python_file(temp_path)
+        assert "_internal_state" in names, "Protected attribute '_internal_state' should be detected"
+        assert "_cache" in names, "Protected attribute '_cache' should be detected"
 
-            # Query for attribute with class association using definedIn property
-            result = reter_instance.reql("""
-                SELECT ?attr ?class
-                WHERE {
-                    ?attr concept "py:Attribute" .
-                    ?attr name "plugins" .
-                    ?attr definedIn ?class
-                }
-            """)
+    def test_private_attributes_detected(self, attribute_names_by_visibility):
+        """Test that private attributes (double underscore) are correctly detected."""
+        names = attribute_names_by_visibility.get("private", set())
 
-            assert result.num_rows > 0, "Attribute should be associated with class"
+        assert "__secret_key" in names, "Private attribute '__secret_key' should be detected"
+        assert "__config" in names, "Private attribute '__config' should be detected"
+
+    def test_attribute_types_detected(self, loaded_reter_attrs):
+        """Test that attribute types are correctly inferred from constructor calls."""
+        # Query for attribute with specific type using REQL
+        result = loaded_reter_attrs.reql("""
+            SELECT ?attr ?type
+            WHERE {
+                ?attr concept "py:Attribute" .
+                ?attr name "plugin_loader" .
+                ?attr hasType ?type
+            }
+        """)
+
+        assert result.num_rows > 0, "Attribute 'plugin_loader' should have type"
+
+        # Verify the type is correct (should be PluginLoader from same module).
+        # to_pylist() on the small result avoids boxing an Arrow scalar.
+        type_value = result.column('?type').to_pylist()[0]
+        assert "PluginLoader" in type_value, f"Expected PluginLoader type, got {type_value}"
+
+    def test_attributes_have_class_association(self, loaded_reter_attrs):
+        """Test that attributes are associated with their parent class."""
+        # Query for attribute with class association using definedIn property
+        result = loaded_reter_attrs.reql("""
+            SELECT ?attr ?class
+            WHERE {
+                ?attr concept "py:Attribute" .
+                ?attr name "plugins" .
+                ?attr definedIn ?class
+            }
+        """)
 
-            # Verify the class name
-            if result.num_rows > 0:
-                class_value = result.column('?class')[0].as_py()
-                assert "PluginManager" in class_value, f"Expected PluginManager class, got {class_value}"
+        assert result.num_rows > 0, "Attribute should be associated with class"
 
-        finally:
-            os.unlink(temp_path)
+        # Verify the class name
+        class_value = result.column('?class').to_pylist()[0]
+        assert "PluginManager" in class_value, f"Expected PluginManager class, got {class_value}"
 
 
 class TestMethodCallResolution:
     """Test method call resolution using type inference."""
 
-    def test_method_to_method_calls(self, reter_instance, sample_code_with_method_calls):
+    def test_method_to_method_calls(self, loaded_reter_calls):
         """Test that method-to-method calls within same class are resolved."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(sample_code_with_method_calls)
-            f.flush()
-            temp_path = f.name
+        # Query for calls relationship
+        result = loaded_reter_calls.reql("""
+            SELECT ?caller ?callee
+            WHERE {
+                ?caller calls ?callee
+            }
+        """)
 
-        try:
-            reter_instance.load_python_file(temp_path)
+        assert result.num_rows > 0, "Should find method calls"
 
-            # Query for calls relationship
-            result = reter_instance.reql("""
-                SELECT ?caller ?callee
-                WHERE {
-                    ?caller calls ?callee
-                }
-            """)
-
-            assert result.num_rows > 0, "Should find method calls"
-
-        finally:
-            os.unlink(temp_path)
-
-    def test_cross_object_method_calls(self, reter_instance, sample_code_with_method_calls):
+    def test_cross_object_method_calls(self, loaded_reter_calls):
         """Test that method calls on other objects are resolved using type info."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(sample_code_with_method_calls)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            reter_instance.load_python_file(temp_path)
-
-            # Look for calls from Server.initialize to PluginManager.load_all_plugins
-            result = reter_instance.reql("""
-                SELECT ?caller ?callee
-                WHERE {
-                    ?caller calls ?callee .
-                    ?caller name "initialize" .
-                    ?callee name "load_all_plugins"
-                }
-            """)
-
-            assert result.num_rows > 0, "Should resolve cross-object method calls"
-
-        finally:
-            os.unlink(temp_path)
-
-    def test_method_call_chain_resolution(self, reter_instance, sample_code_with_method_calls):
+        # Look for calls from Server.initialize to PluginManager.load_all_plugins
+        result = loaded_reter_calls.reql("""
+            SELECT ?caller ?callee
+            WHERE {
+                ?caller calls ?callee .
+                ?caller name "initialize" .
+                ?callee name "load_all_plugins"
+            }
+        """)
+
+        assert result.num_rows > 0, "Should resolve cross-object method calls"
+
+    def test_method_call_chain_resolution(self, loaded_reter_calls):
         """Test that chained method calls are resolved correctly."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(sample_code_with_method_calls)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            reter_instance.load_python_file(temp_path)
-
-            # Query for any calls from initialize method
-            result = reter_instance.reql("""
-                SELECT ?caller ?callee
-                WHERE {
-                    ?caller calls ?callee .
-                    ?caller name "initialize"
-                }
-            """)
-
-            # Should have multiple calls from initialize method
-            assert result.num_rows >= 3, f"Expected at least 3 calls from initialize, got {result.num_rows}"
+        # Query for any calls from initialize method
+        result = loaded_reter_calls.reql("""
+            SELECT ?caller ?callee
+            WHERE {
+                ?caller calls ?callee .
+                ?caller name "initialize"
+            }
+        """)
 
-        finally:
-            os.unlink(temp_path)
+        # Should have multiple calls from initialize method
+        assert result.num_rows >= 3, f"Expected at least 3 calls from initialize, got {result.num_rows}"
 
 
 class TestTypeTracking:
     """Test type tracking across methods and scopes."""
 
-    def test_type_persists_across_methods(self, reter_instance, sample_code_with_method_calls):
+    def test_type_persists_across_methods(self, loaded_reter_calls):
         """Test that types assigned in __init__ are visible in other methods."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(sample_code_with_method_calls)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            reter_instance.load_python_file(temp_path)
-
-            # Look for calls that rely on types from __init__
-            result = reter_instance.reql("""
-                SELECT ?caller ?callee
-                WHERE {
-                    ?caller calls ?callee .
-                    ?callee name "load_all_plugins"
-                }
-            """)
-
-            # This call is in initialize() but type is set in __init__()
-            assert result.num_rows > 0, "Type tracking should persist across methods"
-
-        finally:
-            os.unlink(temp_path)
-
-    def test_multiple_attributes_same_method(self, reter_instance, sample_code_with_method_calls):
+        # Look for calls that rely on types from __init__
+        result = loaded_reter_calls.reql("""
+            SELECT ?caller ?callee
+            WHERE {
+                ?caller calls ?callee .
+                ?callee name "load_all_plugins"
+            }
+        """)
+
+        # This call is in initialize() but type is set in __init__()
+        assert result.num_rows > 0, "Type tracking should persist across methods"
+
+    def test_multiple_attributes_same_method(self, loaded_reter_calls):
         """Test that multiple attributes in same method are tracked correctly."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(sample_code_with_method_calls)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            reter_instance.load_python_file(temp_path)
-
-            # Check that both manager and config attributes exist using definedIn property
-            result = reter_instance.reql("""
-                SELECT ?attr
-                WHERE {
-                    ?attr concept "py:Attribute" .
-                    ?attr definedIn ?class .
-                    ?class name "Server"
-                }
-            """)
-
-            # Should have at least manager and config attributes
-            assert result.num_rows >= 2, f"Expected at least 2 attributes, got {result.num_rows}"
-
-        finally:
-            os.unlink(temp_path)
+        # Check that both manager and config attributes exist using definedIn property
+        result = loaded_reter_calls.reql("""
+            SELECT ?attr
+            WHERE {
+                ?attr concept "py:Attribute" .
+                ?attr definedIn ?class .
+                ?class name "Server"
+            }
+        """)
+
+        # Should have at least manager and config attributes
+        assert result.num_rows >= 2, f"Expected at least 2 attributes, got {result.num_rows}"
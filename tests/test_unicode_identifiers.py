@@ -0,0 +1,37 @@
+"""
+Test that identifiers keep their exact Unicode spelling across the API
+
+No entry point normalizes text, so an identifier written in decomposed
+form (e + U+0301 COMBINING ACUTE ACCENT) must match itself everywhere.
+"""
+from reter import Reter
+
+CAFE = "cafe\u0301"  # decomposed; NFC would turn it into "caf\u00e9"
+
+
+def test_decomposed_identifier_from_ontology():
+    """An entity loaded from DL text is found by query(), pattern() and add_triple()"""
+    r = Reter()
+    r.load_ontology(f"Place（{CAFE}）")
+
+    places = r.query(type='instance_of', concept='Place')
+    assert [f['individual'] for f in places] == [CAFE]
+
+    r.add_triple(CAFE, "locatedIn", "Paris")
+    results = r.pattern(
+        ("?x", "type", "Place"),
+        ("?x", "locatedIn", "?city")
+    )
+    assert results.to_list() == [{"?x": CAFE, "?city": "Paris"}]
+
+
+def test_decomposed_identifier_from_add_triple():
+    """An entity added with add_triple() is found by query() and reql() unchanged"""
+    r = Reter()
+    r.add_triple(CAFE, "type", "Place")
+
+    facts = r.query(type='instance_of', individual=CAFE)
+    assert len(facts) == 1
+
+    table = r.reql("SELECT ?x WHERE { ?x type Place }")
+    assert table.column("?x").to_pylist() == [CAFE]
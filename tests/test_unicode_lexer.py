@@ -7,6 +7,13 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from reter import Reter
 
+def _index_pairs(facts, first, second, symmetric=False):
+    """Index facts as a set of (first, second) pairs for O(1) membership checks"""
+    pairs = {(f.get(first), f.get(second)) for f in facts}
+    if symmetric:
+        pairs |= {(b, a) for a, b in pairs}
+    return pairs
+
 def test_basic_subsumption():
     """Test: Basic class subsumption with new ⊑ᑦ token"""
     print("=" * 60)
@@ -25,9 +32,10 @@ def test_basic_subsumption():
     subs = reasoner.query(type='subsumption')
     print(f"\nSubsumptions found: {len(subs)}")
 
-    student_person = any(s.get('sub') == 'Student' and s.get('sup') == 'Person' for s in subs)
-    person_animal = any(s.get('sub') == 'Person' and s.get('sup') == 'Animal' for s in subs)
-    student_animal = any(s.get('sub') == 'Student' and s.get('sup') == 'Animal' for s in subs)
+    idx = _index_pairs(subs, 'sub', 'sup')
+    student_person = ('Student', 'Person') in idx
+    person_animal = ('Person', 'Animal') in idx
+    student_animal = ('Student', 'Animal') in idx
 
     print(f"  Student ⊑ᑦ Person: {student_person}")
     print(f"  Person ⊑ᑦ Animal: {person_animal}")
@@ -53,11 +61,7 @@ def test_equivalence():
     equivs = reasoner.query(type='equivalence')
     print(f"\nEquivalences found: {len(equivs)}")
 
-    human_person = any(
-        (e.get('concept1') == 'Human' and e.get('concept2') == 'Person') or
-        (e.get('concept1') == 'Person' and e.get('concept2') == 'Human')
-        for e in equivs
-    )
+    human_person = ('Human', 'Person') in _index_pairs(equivs, 'concept1', 'concept2', symmetric=True)
 
     print(f"  Human ≡ᑦ Person: {human_person}")
 
@@ -80,26 +84,21 @@ def test_fullwidth_punctuation():
     reasoner.load_ontology(ontology)
     
 
-    # Check instance
-    alice_concepts = reasoner.query(type='instance_of', individual='Alice')
-    print(f"\nAlice's concepts: {len(alice_concepts)}")
+    # Check instance (any one concept is enough)
+    alice_has_concept = next(reasoner.iter_query(type='instance_of', individual='Alice'), None) is not None
 
     # Check equivalence list
     equivs = reasoner.query(type='equivalence')
-    person_human = any(
-        (e.get('concept1') == 'Person' and e.get('concept2') == 'Human') or
-        (e.get('concept1') == 'Human' and e.get('concept2') == 'Person')
-        for e in equivs
-    )
+    person_human = ('Person', 'Human') in _index_pairs(equivs, 'concept1', 'concept2', symmetric=True)
 
     # Check instance set
-    bob_concepts = reasoner.query(type='instance_of', individual='Bob')
+    bob_has_concept = next(reasoner.iter_query(type='instance_of', individual='Bob'), None) is not None
 
-    print(f"  Alice has concepts: {len(alice_concepts) > 0}")
+    print(f"\n  Alice has concepts: {alice_has_concept}")
     print(f"  Person ≡ᑦ Human: {person_human}")
-    print(f"  Bob has instance_set concept: {len(bob_concepts) > 0}")
+    print(f"  Bob has instance_set concept: {bob_has_concept}")
 
-    success = len(alice_concepts) > 0 and person_human and len(bob_concepts) > 0
+    success = alice_has_concept and person_human and bob_has_concept
     print(f"\n{'✓ PASS' if success else '✗ FAIL'}")
     return success
 
@@ -120,9 +119,10 @@ def test_role_subsumption():
     prop_subs = reasoner.query(type='sub_property')
     print(f"\nProperty subsumptions found: {len(prop_subs)}")
 
-    father_parent = any(s.get('sub') == 'hasFather' and s.get('sup') == 'hasParent' for s in prop_subs)
-    parent_ancestor = any(s.get('sub') == 'hasParent' and s.get('sup') == 'hasAncestor' for s in prop_subs)
-    father_ancestor = any(s.get('sub') == 'hasFather' and s.get('sup') == 'hasAncestor' for s in prop_subs)
+    idx = _index_pairs(prop_subs, 'sub', 'sup')
+    father_parent = ('hasFather', 'hasParent') in idx
+    parent_ancestor = ('hasParent', 'hasAncestor') in idx
+    father_ancestor = ('hasFather', 'hasAncestor') in idx
 
     print(f"  hasFather ⊑ᴿ hasParent: {father_parent}")
     print(f"  hasParent ⊑ᴿ hasAncestor: {parent_ancestor}")
@@ -149,8 +149,9 @@ def test_data_property_subsumption():
     data_props = reasoner.query(type='data_property_declaration')
     print(f"\nData properties detected: {len(data_props)}")
 
-    has_age = any(p.get('property') == 'age' for p in data_props)
-    has_weight = any(p.get('property') == 'weight' for p in data_props)
+    properties = {p.get('property') for p in data_props}
+    has_age = 'age' in properties
+    has_weight = 'weight' in properties
 
     print(f"  age detected: {has_age}")
     print(f"  weight detected: {has_weight}")
@@ -172,12 +173,9 @@ def test_has_key():
     reasoner.load_ontology(ontology)
     
 
-    has_keys = reasoner.query(type='has_key')
-    print(f"\nHasKey axioms found: {len(has_keys)}")
-
     person_ssn = any(
-        hk.get('class') == 'Person' and 'ssn' in str(hk.get('keys', ''))
-        for hk in has_keys
+        'ssn' in str(hk.get('keys', ''))
+        for hk in reasoner.iter_query(type='has_key', **{'class': 'Person'})
     )
 
     print(f"  Person ⊑ᴷ (ssn): {person_ssn}")
@@ -206,17 +204,8 @@ def test_fullwidth_comparison():
     print(f"\nSame-as facts: {len(same)}")
     print(f"Different-from facts: {len(diff)}")
 
-    john_same = any(
-        (s.get('ind1') == 'John' and s.get('ind2') == 'JohnDoe') or
-        (s.get('ind1') == 'JohnDoe' and s.get('ind2') == 'John')
-        for s in same
-    )
-
-    alice_bob_diff = any(
-        (d.get('ind1') == 'Alice' and d.get('ind2') == 'Bob') or
-        (d.get('ind1') == 'Bob' and d.get('ind2') == 'Alice')
-        for d in diff
-    )
+    john_same = ('John', 'JohnDoe') in _index_pairs(same, 'ind1', 'ind2', symmetric=True)
+    alice_bob_diff = ('Alice', 'Bob') in _index_pairs(diff, 'ind1', 'ind2', symmetric=True)
 
     print(f"  John ﹦ JohnDoe: {john_same}")
     print(f"  Alice ≠ Bob: {alice_bob_diff}")
@@ -242,15 +231,9 @@ def test_boolean_literals():
     data_assertions = reasoner.query(type='data_property_assertion')
     print(f"\nData property assertions: {len(data_assertions)}")
 
-    system1_true = any(
-        d.get('subject') == 'System1' and d.get('property') == 'isActive'
-        for d in data_assertions
-    )
-
-    system2_false = any(
-        d.get('subject') == 'System2' and d.get('property') == 'isDisabled'
-        for d in data_assertions
-    )
+    idx = _index_pairs(data_assertions, 'subject', 'property')
+    system1_true = ('System1', 'isActive') in idx
+    system2_false = ('System2', 'isDisabled') in idx
 
     print(f"  isActive(System1， 𝚃): {system1_true}")
     print(f"  isDisabled(System2， 𝙵): {system2_false}")
@@ -276,15 +259,9 @@ def test_restrictions_with_unicode_dot():
     restrictions = reasoner.query(type='some_values_from')
     print(f"\nSomeValuesFrom restrictions: {len(restrictions)}")
 
-    parent_restriction = any(
-        r.get('property') == 'hasChild' and r.get('filler') == 'Person'
-        for r in restrictions
-    )
-
-    grandparent_restriction = any(
-        r.get('property') == 'hasChild' and r.get('filler') == 'Parent'
-        for r in restrictions
-    )
+    idx = _index_pairs(restrictions, 'property', 'filler')
+    parent_restriction = ('hasChild', 'Person') in idx
+    grandparent_restriction = ('hasChild', 'Parent') in idx
 
     print(f"  ∃hasChild․Person: {parent_restriction}")
     print(f"  ∃hasChild․Parent: {grandparent_restriction}")
@@ -310,15 +287,9 @@ def test_namespace_with_fullwidth_colon():
     subs = reasoner.query(type='subsumption')
     print(f"\nSubsumptions found: {len(subs)}")
 
-    owl_thing_reflexive = any(
-        s.get('sub') == 'owl:Thing' and s.get('sup') == 'owl:Thing'
-        for s in subs
-    )
-
-    foaf_person = any(
-        s.get('sub') == 'foaf:Person' and s.get('sup') == 'owl:Thing'
-        for s in subs
-    )
+    idx = _index_pairs(subs, 'sub', 'sup')
+    owl_thing_reflexive = ('owl:Thing', 'owl:Thing') in idx
+    foaf_person = ('foaf:Person', 'owl:Thing') in idx
 
     print(f"  owl:Thing ⊑ᑦ owl:Thing: {owl_thing_reflexive}")
     print(f"  foaf:Person ⊑ᑦ owl:Thing: {foaf_person}")
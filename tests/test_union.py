@@ -11,20 +11,57 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(__file__))
 
+import pytest
+
 from reter import Reter
 
+# Only used by run_all_tests(); under pytest, test_union_pandas skips itself
+try:
+    import pandas  # noqa: F401
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# Ontologies shared by several read-only tests
+PEOPLE_AND_STUDENTS = """
+    Person（john）
+    Person（mary）
+    Student（alice）
+    Student（bob）
+"""
+
+AGES_AND_CITIES = """
+    Person（john）
+    Person（mary）
+    hasAge（john，30）
+    livesIn（mary，NYC）
+"""
+
+
+def _build_reter(ontology):
+    """Build a reasoner for one of the shared ontologies"""
+    r = Reter()
+    r.load_ontology(ontology)
+    return r
 
-def test_union_basic():
+
+@pytest.fixture(scope="module")
+def people_and_students():
+    """PEOPLE_AND_STUDENTS reasoner built once per module (tests only query it)"""
+    return _build_reter(PEOPLE_AND_STUDENTS)
+
+
+@pytest.fixture(scope="module")
+def ages_and_cities():
+    """AGES_AND_CITIES reasoner built once per module (tests only query it)"""
+    return _build_reter(AGES_AND_CITIES)
+
+
+def test_union_basic(people_and_students):
     """Test basic UNION of two queries"""
     print("\n=== Test 1: Basic UNION ===")
 
-    r = Reter()
-    r.load_ontology("""
-        Person（john）
-        Person（mary）
-        Student（alice）
-        Student（bob）
-    """)
+    r = people_and_students
 
     # Get people OR students
     q1 = r.pattern(("?x", "type", "Person"))
@@ -108,17 +145,11 @@ def test_union_three_queries():
     print("✓ Three-query UNION test passed")
 
 
-def test_union_different_variables():
+def test_union_different_variables(ages_and_cities):
     """Test UNION with queries having different variables"""
     print("\n=== Test 4: UNION with different variables ===")
 
-    r = Reter()
-    r.load_ontology("""
-        Person（john）
-        Person（mary）
-        hasAge（john，30）
-        livesIn（mary，NYC）
-    """)
+    r = ages_and_cities
 
     # Query 1: Get people and their ages
     q1 = r.pattern(
@@ -141,8 +172,9 @@ def test_union_different_variables():
     assert len(result_list) == 2, f"Expected 2 results, got {len(result_list)}"
 
     # john should have ?age, mary should have ?city
-    john = next((r for r in result_list if r.get("?x") == "john"), None)
-    mary = next((r for r in result_list if r.get("?x") == "mary"), None)
+    by_x = {r.get("?x"): r for r in result_list}
+    john = by_x.get("john")
+    mary = by_x.get("mary")
 
     assert john is not None and "?age" in john
     assert mary is not None and "?city" in mary
@@ -294,23 +326,13 @@ def test_union_iteration():
     print("✓ Iteration test passed")
 
 
-def test_union_pandas():
+def test_union_pandas(people_and_students):
     """Test pandas conversion with UNION"""
     print("\n=== Test 9: UNION with pandas ===")
 
-    try:
-        import pandas as pd
-    except ImportError:
-        print("⊘ pandas not installed, skipping test")
-        return
+    pd = pytest.importorskip("pandas")
 
-    r = Reter()
-    r.load_ontology("""
-        Person（john）
-        Person（mary）
-        Student（alice）
-        Student（bob）
-    """)
+    r = people_and_students
 
     q1 = r.pattern(("?x", "type", "Person"))
     q2 = r.pattern(("?x", "type", "Student"))
@@ -322,6 +344,7 @@ def test_union_pandas():
     print(f"DataFrame shape: {df.shape}")
     print(df)
 
+    assert isinstance(df, pd.DataFrame)
     assert "?x" in df.columns
     assert len(df) == 4
 
@@ -331,17 +354,11 @@ def test_union_pandas():
     print("✓ Pandas test passed")
 
 
-def test_union_select():
+def test_union_select(ages_and_cities):
     """Test UNION with variable selection"""
     print("\n=== Test 10: UNION with select ===")
 
-    r = Reter()
-    r.load_ontology("""
-        Person（john）
-        Person（mary）
-        hasAge（john，30）
-        livesIn（mary，NYC）
-    """)
+    r = ages_and_cities
 
     # Both queries select only ?x
     q1 = r.pattern(
@@ -371,37 +388,72 @@ def test_union_select():
     print("✓ Select test passed")
 
 
+def test_union_sees_facts_added_after_pattern():
+    """Test UNION merges the branches' current results, not a pattern()-time snapshot"""
+    print("\n=== Test 11: UNION after new facts ===")
+
+    r = Reter()
+    r.load_ontology("""
+        Person（john）
+    """)
+
+    q1 = r.pattern(("?x", "type", "Person"))
+    q2 = r.pattern(("?x", "type", "Student"))  # Empty when the pattern is built
+
+    r.add_triple("alice", "type", "Student")
+
+    results = r.union(q1, q2)
+    individuals = {b["?x"] for b in results.to_list()}
+    assert individuals == {"john", "alice"}, f"Unexpected individuals: {individuals}"
+
+    print("✓ UNION after new facts test passed")
+
+
 def run_all_tests():
     """Run all UNION tests"""
     print("=" * 70)
     print("UNION Support Test Suite (Week 5, Day 4-5)")
     print("=" * 70)
 
+    # Shared reasoners for the read-only tests that take them as fixtures
+    people_and_students = _build_reter(PEOPLE_AND_STUDENTS)
+    ages_and_cities = _build_reter(AGES_AND_CITIES)
+
     tests = [
-        test_union_basic,
-        test_union_with_overlap,
-        test_union_three_queries,
-        test_union_different_variables,
-        test_union_empty_query,
-        test_union_with_filters,
-        test_union_with_values,
-        test_union_iteration,
-        test_union_pandas,
-        test_union_select,
+        (test_union_basic, (people_and_students,)),
+        (test_union_with_overlap, ()),
+        (test_union_three_queries, ()),
+        (test_union_different_variables, (ages_and_cities,)),
+        (test_union_empty_query, ()),
+        (test_union_with_filters, ()),
+        (test_union_with_values, ()),
+        (test_union_iteration, ()),
+        (test_union_pandas, (people_and_students,)),
+        (test_union_select, (ages_and_cities,)),
+        (test_union_sees_facts_added_after_pattern, ()),
     ]
 
     passed = 0
-    failed = 0
+    failures = []
 
-    for test in tests:
+    for test, args in tests:
+        if test is test_union_pandas and not PANDAS_AVAILABLE:
+            print("\n⊘ pandas not installed, skipping test_union_pandas")
+            continue
         try:
-            test()
+            test(*args)
             passed += 1
         except Exception as e:
             print(f"✗ Test {test.__name__} FAILED: {e}")
-            import traceback
-            traceback.print_exc()
-            failed += 1
+            failures.append(e)
+    failed = len(failures)
+
+    # Full tracebacks only on request (VERBOSE=1); the one-line summary above
+    # is enough on the common path
+    if failures and os.environ.get("VERBOSE"):
+        import traceback
+        for e in failures:
+            traceback.print_exception(type(e), e, e.__traceback__)
 
     print("\n" + "=" * 70)
     print(f"Test Results: {passed} passed, {failed} failed")
@@ -26,137 +26,107 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../s
 import pytest
 from reter.reasoner import Reter
 
+# Code-like ontology (no comments allowed in ontology string)
+CODE_FACTS_ONTOLOGY = """
+Method ⊑ᑦ Function
+pyMethod（method1）
+pyMethod（method2）
+pyMethod（method3）
+ooFunction（func1）
+name（method1，execute）
+name（method2，run）
+name（method3，process）
+name（func1，helper）
+concept（method1，pyMethod）
+concept（method2，pyMethod）
+concept（method3，pyMethod）
+concept（func1，ooFunction）
+calls（method1，method2）
+calls（method2，method3）
+maybeCalls（method1，func1）
+"""
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def reter_with_code_facts():
-    """Create a Reter instance with code-like facts for testing."""
+    """Create a Reter instance with code-like facts (shared, tests only query it)."""
     r = Reter()
-
-    # Load code-like ontology (no comments allowed in ontology string)
-    ontology = """
-    Method ⊑ᑦ Function
-    pyMethod（method1）
-    pyMethod（method2）
-    pyMethod（method3）
-    ooFunction（func1）
-    name（method1，execute）
-    name（method2，run）
-    name（method3，process）
-    name（func1，helper）
-    concept（method1，pyMethod）
-    concept（method2，pyMethod）
-    concept（method3，pyMethod）
-    concept（func1，ooFunction）
-    calls（method1，method2）
-    calls（method2，method3）
-    maybeCalls（method1，func1）
-    """
-    r.load_ontology(ontology)
+    r.load_ontology(CODE_FACTS_ONTOLOGY)
     return r
 
 
-class TestFilterWithoutUnion:
-    """Tests for FILTER without UNION - should work correctly."""
-
-    def test_filter_on_variable_in_select(self, reter_with_code_facts):
-        """FILTER on variable that IS in SELECT - should always work."""
-        r = reter_with_code_facts
-
-        query = """
+# (query, columns that must be present) for the four FILTER/UNION combinations.
+# ?t may additionally appear in results as an implementation detail of filtering;
+# the key point is that every query runs without "Variable not found".
+FILTER_VARIABLE_CASES = [
+    # Without UNION, FILTER variable in SELECT - should always work
+    pytest.param(
+        """
         SELECT ?x ?name ?t WHERE {
             ?x type pyMethod .
             ?x name ?name .
             ?x concept ?t .
             FILTER(CONTAINS(?t, "Method"))
         }
+        """,
+        {"?x", "?name", "?t"},
+        id="no-union-var-in-select",
+    ),
+    # Without UNION, FILTER variable NOT in SELECT - should work
+    pytest.param(
         """
-
-        results = r.reql(query)
-        assert results.num_rows >= 1, "Should find at least one method"
-        assert "?x" in results.column_names
-        assert "?name" in results.column_names
-        assert "?t" in results.column_names
-        print(f"✓ Filter on variable in SELECT (no UNION): {results.num_rows} results")
-
-    def test_filter_on_variable_not_in_select(self, reter_with_code_facts):
-        """FILTER on variable NOT in SELECT - should work without UNION."""
-        r = reter_with_code_facts
-
-        # Note: ?t is used in FILTER but NOT in SELECT
-        query = """
         SELECT ?x ?name WHERE {
             ?x type pyMethod .
             ?x name ?name .
             ?x concept ?t .
             FILTER(CONTAINS(?t, "Method"))
         }
+        """,
+        {"?x", "?name"},
+        id="no-union-var-not-in-select",
+    ),
+    # With UNION, FILTER variable in SELECT - should work
+    pytest.param(
         """
-
-        results = r.reql(query)
-        assert results.num_rows >= 1, "Should find at least one method"
-        assert "?x" in results.column_names
-        assert "?name" in results.column_names
-        # Note: ?t may or may not be in results depending on implementation
-        # The key point is that the query works and filters correctly
-        print(f"✓ Filter on variable NOT in SELECT (no UNION): {results.num_rows} results")
-
-
-class TestFilterWithUnion:
-    """Tests for FILTER with UNION - this is where the bug manifests."""
-
-    def test_union_filter_on_variable_in_select(self, reter_with_code_facts):
-        """FILTER on variable that IS in SELECT with UNION - should work."""
-        r = reter_with_code_facts
-
-        # ?t is in SELECT, so this should work
-        query = """
         SELECT ?caller ?callee ?t WHERE {
             { ?caller calls ?callee } UNION { ?caller maybeCalls ?callee }
             ?caller name ?name .
             ?caller concept ?t .
             FILTER(CONTAINS(?t, "Method"))
         }
+        """,
+        {"?caller", "?callee", "?t"},
+        id="union-var-in-select",
+    ),
+    # BUG: with UNION, FILTER variable NOT in SELECT.
+    # Before fix: Fails with "Variable not found in query results: ?t"
+    # After fix: Should work correctly (same as without UNION)
+    pytest.param(
         """
-
-        results = r.reql(query)
-        assert results.num_rows >= 1, "Should find at least one call relationship"
-        assert "?caller" in results.column_names
-        assert "?callee" in results.column_names
-        assert "?t" in results.column_names
-        print(f"✓ UNION with FILTER on variable in SELECT: {results.num_rows} results")
-
-    def test_union_filter_on_variable_not_in_select_bug(self, reter_with_code_facts):
-        """
-        BUG TEST: FILTER on variable NOT in SELECT with UNION.
-
-        This test demonstrates the bug:
-        - ?t is used in FILTER(CONTAINS(?t, "Method"))
-        - ?t is NOT in SELECT
-        - UNION is present
-
-        Before fix: Fails with "Variable not found in query results: ?t"
-        After fix: Should work correctly (same as without UNION)
-        """
-        r = reter_with_code_facts
-
-        # ?t is NOT in SELECT - this fails with UNION but works without
-        query = """
         SELECT ?caller ?callee WHERE {
             { ?caller calls ?callee } UNION { ?caller maybeCalls ?callee }
             ?caller name ?name .
             ?caller concept ?t .
             FILTER(CONTAINS(?t, "Method"))
         }
-        """
+        """,
+        {"?caller", "?callee"},
+        id="union-var-not-in-select-bug",
+    ),
+]
 
-        # This is the bug - should work but currently fails
-        results = r.reql(query)
-        assert results.num_rows >= 1, "Should find at least one call relationship"
-        assert "?caller" in results.column_names
-        assert "?callee" in results.column_names
-        # Note: ?t may be in results as implementation detail for filtering
-        # The key point is that the query works without throwing "Variable not found"
-        print(f"✓ UNION with FILTER on variable NOT in SELECT (BUG FIX): {results.num_rows} results")
+
+@pytest.mark.parametrize("query, expected_columns", FILTER_VARIABLE_CASES)
+def test_union_filter_matrix(reter_with_code_facts, query, expected_columns):
+    """FILTER on variables in/not in SELECT, with and without UNION."""
+    results = reter_with_code_facts.reql(query)
+    assert results.num_rows >= 1, "Should find at least one result"
+    columns = set(results.column_names)
+    assert expected_columns <= columns, f"Missing columns: {expected_columns - columns}"
+
+
+class TestFilterWithUnion:
+    """Tests for FILTER with UNION - this is where the bug manifests."""
 
     def test_union_filter_multiple_variables_not_in_select(self, reter_with_code_facts):
         """
@@ -176,11 +146,9 @@ class TestFilterWithUnion:
 
         results = r.reql(query)
         # Should work after fix - query executes without error
-        assert "?caller" in results.column_names
-        assert "?callee" in results.column_names
+        assert {"?caller", "?callee"} <= set(results.column_names)
         # Note: ?t and ?name may be in results as implementation detail for filtering
         # The key point is that the query works without throwing "Variable not found"
-        print(f"✓ UNION with multiple FILTER vars NOT in SELECT: {results.num_rows} results")
 
 
 class TestConsistencyBetweenUnionAndNonUnion:
@@ -220,104 +188,11 @@ class TestConsistencyBetweenUnionAndNonUnion:
         # Both should return results (after deduplication, UNION might return same count)
         assert results_no_union.num_rows >= 1
         assert results_with_union.num_rows >= 1
-        print(f"✓ Consistency check: no UNION={results_no_union.num_rows}, "
-              f"with UNION={results_with_union.num_rows}")
 
 
 def run_tests():
     """Run all tests manually (for debugging)."""
-    r = Reter()
-
-    # Load code-like ontology (no comments allowed in ontology string)
-    ontology = """
-    Method ⊑ᑦ Function
-    pyMethod（method1）
-    pyMethod（method2）
-    pyMethod（method3）
-    ooFunction（func1）
-    name（method1，execute）
-    name（method2，run）
-    name（method3，process）
-    name（func1，helper）
-    concept（method1，pyMethod）
-    concept（method2，pyMethod）
-    concept（method3，pyMethod）
-    concept（func1，ooFunction）
-    calls（method1，method2）
-    calls（method2，method3）
-    maybeCalls（method1，func1）
-    """
-    r.load_ontology(ontology)
-
-    print("=" * 70)
-    print("UNION + FILTER Variable Bug Test Suite")
-    print("=" * 70)
-
-    # Test 1: Without UNION, variable in SELECT
-    print("\n--- Test 1: Without UNION, FILTER var in SELECT ---")
-    try:
-        query = """
-        SELECT ?x ?name ?t WHERE {
-            ?x type pyMethod .
-            ?x name ?name .
-            ?x concept ?t .
-            FILTER(CONTAINS(?t, "Method"))
-        }
-        """
-        results = r.reql(query)
-        print(f"✓ PASS: {results.num_rows} results")
-    except Exception as e:
-        print(f"✗ FAIL: {e}")
-
-    # Test 2: Without UNION, variable NOT in SELECT
-    print("\n--- Test 2: Without UNION, FILTER var NOT in SELECT ---")
-    try:
-        query = """
-        SELECT ?x ?name WHERE {
-            ?x type pyMethod .
-            ?x name ?name .
-            ?x concept ?t .
-            FILTER(CONTAINS(?t, "Method"))
-        }
-        """
-        results = r.reql(query)
-        print(f"✓ PASS: {results.num_rows} results")
-    except Exception as e:
-        print(f"✗ FAIL: {e}")
-
-    # Test 3: With UNION, variable in SELECT
-    print("\n--- Test 3: With UNION, FILTER var in SELECT ---")
-    try:
-        query = """
-        SELECT ?caller ?callee ?t WHERE {
-            { ?caller calls ?callee } UNION { ?caller maybeCalls ?callee }
-            ?caller name ?name .
-            ?caller concept ?t .
-            FILTER(CONTAINS(?t, "Method"))
-        }
-        """
-        results = r.reql(query)
-        print(f"✓ PASS: {results.num_rows} results")
-    except Exception as e:
-        print(f"✗ FAIL: {e}")
-
-    # Test 4: With UNION, variable NOT in SELECT (THE BUG)
-    print("\n--- Test 4: With UNION, FILTER var NOT in SELECT (BUG) ---")
-    try:
-        query = """
-        SELECT ?caller ?callee WHERE {
-            { ?caller calls ?callee } UNION { ?caller maybeCalls ?callee }
-            ?caller name ?name .
-            ?caller concept ?t .
-            FILTER(CONTAINS(?t, "Method"))
-        }
-        """
-        results = r.reql(query)
-        print(f"✓ PASS (BUG FIXED): {results.num_rows} results")
-    except Exception as e:
-        print(f"✗ FAIL (BUG EXISTS): {e}")
-
-    print("\n" + "=" * 70)
+    return pytest.main([__file__, "-v", "-s"])
 
 
 if __name__ == "__main__":
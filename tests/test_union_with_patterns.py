@@ -11,37 +11,39 @@ This is failing with "Variable not found in query results" error.
 import pytest
 from reter import Reter
 
+DATA_ONTOLOGY = """
+py:Method（m1）
+py:Method（m2）
+py:Function（f1）
+py:Function（f2）
+
+name（m1，"method1"）
+name（m2，"method2"）
+name（f1，"function1"）
+name（f2，"function2"）
+
+inFile（m1，"file1.py"）
+inFile（m2，"file1.py"）
+inFile（f1，"file2.py"）
+inFile（f2，"file2.py"）
+
+atLine（m1，"10"）
+atLine（m2，"20"）
+atLine（f1，"30"）
+atLine（f2，"40"）
+
+calls（m1，"execute_select"）
+calls（m2，"other_func"）
+calls（f1，"execute_select"）
+calls（f2，"third_func"）
+"""
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def reasoner_with_data():
-    """Create a reasoner with test data"""
+    """Create a reasoner with test data (shared, tests only query it)"""
     r = Reter()
-    r.load_ontology("""
-        py:Method（m1）
-        py:Method（m2）
-        py:Function（f1）
-        py:Function（f2）
-
-        name（m1，"method1"）
-        name（m2，"method2"）
-        name（f1，"function1"）
-        name（f2，"function2"）
-
-        inFile（m1，"file1.py"）
-        inFile（m2，"file1.py"）
-        inFile（f1，"file2.py"）
-        inFile（f2，"file2.py"）
-
-        atLine（m1，"10"）
-        atLine（m2，"20"）
-        atLine（f1，"30"）
-        atLine（f2，"40"）
-
-        calls（m1，"execute_select"）
-        calls（m2，"other_func"）
-        calls（f1，"execute_select"）
-        calls（f2，"third_func"）
-    """)
+    r.load_ontology(DATA_ONTOLOGY)
     return r
 
 
@@ -51,19 +53,17 @@ class TestUnionBaseline:
     def test_simple_type_query_method(self, reasoner_with_data):
         """Test simple type query for Method"""
         r = reasoner_with_data
-        results = r.reql("SELECT ?x WHERE { ?x type py:Method }").to_pylist()
-        print(f"Methods: {results}")
-        assert len(results) == 2
-        names = {row["?x"] for row in results}
+        results = r.reql("SELECT ?x WHERE { ?x type py:Method }")
+        assert results.num_rows == 2, results.to_pylist()
+        names = set(results.column("?x").to_pylist())
         assert names == {"m1", "m2"}
 
     def test_simple_type_query_function(self, reasoner_with_data):
         """Test simple type query for Function"""
         r = reasoner_with_data
-        results = r.reql("SELECT ?x WHERE { ?x type py:Function }").to_pylist()
-        print(f"Functions: {results}")
-        assert len(results) == 2
-        names = {row["?x"] for row in results}
+        results = r.reql("SELECT ?x WHERE { ?x type py:Function }")
+        assert results.num_rows == 2, results.to_pylist()
+        names = set(results.column("?x").to_pylist())
         assert names == {"f1", "f2"}
 
     def test_union_without_additional_patterns(self, reasoner_with_data):
@@ -76,10 +76,9 @@ class TestUnionBaseline:
                 { ?x type py:Function }
             }
         """
-        results = r.reql(query).to_pylist()
-        print(f"UNION result: {results}")
-        assert len(results) == 4
-        names = {row["?x"] for row in results}
+        results = r.reql(query)
+        assert results.num_rows == 4, results.to_pylist()
+        names = set(results.column("?x").to_pylist())
         assert names == {"m1", "m2", "f1", "f2"}
 
 
@@ -97,12 +96,11 @@ class TestUnionWithAdditionalPatterns:
                 ?x name ?name .
             }
         """
-        results = r.reql(query).to_pylist()
-        print(f"UNION + name pattern: {results}")
+        results = r.reql(query)
 
         # Should return 4 rows (2 methods + 2 functions) with their names
-        assert len(results) == 4
-        names = {row["?name"] for row in results}
+        assert results.num_rows == 4, results.to_pylist()
+        names = set(results.column("?name").to_pylist())
         # Data properties store values with quotes
         assert names == {'"method1"', '"method2"', '"function1"', '"function2"'}
 
@@ -118,11 +116,10 @@ class TestUnionWithAdditionalPatterns:
                 ?x inFile ?file .
             }
         """
-        results = r.reql(query).to_pylist()
-        print(f"UNION + name + file patterns: {results}")
+        results = r.reql(query)
 
         # Should return 4 rows with name and file
-        assert len(results) == 4
+        assert results.num_rows == 4, results.to_pylist()
 
     def test_union_with_filter_on_additional_pattern(self, reasoner_with_data):
         """Test UNION with FILTER on pattern outside UNION - similar to find_usages"""
@@ -137,12 +134,11 @@ class TestUnionWithAdditionalPatterns:
                 FILTER ( CONTAINS(?callee, "execute_select") )
             }
         """
-        results = r.reql(query).to_pylist()
-        print(f"UNION + filter result: {results}")
+        results = r.reql(query)
 
         # Should return m1 and f1 (both call execute_select)
-        assert len(results) == 2
-        names = {row["?name"] for row in results}
+        assert results.num_rows == 2, results.to_pylist()
+        names = set(results.column("?name").to_pylist())
         # Data properties store values with quotes
         assert names == {'"method1"', '"function1"'}
 
@@ -161,9 +157,8 @@ class TestUnionWithPatternsAndTimeout:
                 ?x name ?name .
             }
         """
-        results = r.reql(query, timeout_ms=0).to_pylist()
-        print(f"UNION + pattern (timeout=0): {results}")
-        assert len(results) == 4
+        results = r.reql(query, timeout_ms=0)
+        assert results.num_rows == 4, results.to_pylist()
 
     def test_union_patterns_with_timeout(self, reasoner_with_data):
         """Test with timeout_ms > 0"""
@@ -176,9 +171,8 @@ class TestUnionWithPatternsAndTimeout:
                 ?x name ?name .
             }
         """
-        results = r.reql(query, timeout_ms=5000).to_pylist()
-        print(f"UNION + pattern (timeout=5000): {results}")
-        assert len(results) == 4
+        results = r.reql(query, timeout_ms=5000)
+        assert results.num_rows == 4, results.to_pylist()
 
 
 class TestUnionPatternsInsideBlocks:
@@ -194,12 +188,11 @@ class TestUnionPatternsInsideBlocks:
                 { ?x type py:Function . ?x name ?name }
             }
         """
-        results = r.reql(query).to_pylist()
-        print(f"Patterns inside UNION blocks: {results}")
+        results = r.reql(query)
 
         # Should return 4 rows
-        assert len(results) == 4
-        names = {row["?name"] for row in results}
+        assert results.num_rows == 4, results.to_pylist()
+        names = set(results.column("?name").to_pylist())
         # Data properties store values with quotes
         assert names == {'"method1"', '"method2"', '"function1"', '"function2"'}
 
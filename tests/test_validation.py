@@ -9,14 +9,14 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from reter import Reter
 
+# Flip once reter_core detects complement inconsistencies (cls-com)
+CLS_COM_IMPLEMENTED = False
 
-@pytest.mark.skip(reason="Complement class inconsistency detection (cls-com) not yet implemented")
+
+@pytest.mark.skipif(not CLS_COM_IMPLEMENTED,
+                    reason="Complement class inconsistency detection (cls-com) not yet implemented")
 def test_cls_com():
     """Test cls-com rule (complement inconsistency detection)"""
-    print("\n" + "=" * 60)
-    print("TEST: Complement Inconsistency (cls-com)")
-    print("=" * 60)
-
     reasoner = Reter()
 
     # Define NotStudent as complement of Student (¬Student)
@@ -33,27 +33,16 @@ def test_cls_com():
 
     # Check for inconsistency
     is_consistent, inconsistencies = reasoner.check_consistency()
-    print(f"\nConsistent: {is_consistent}")
-    print(f"Inconsistencies detected: {len(inconsistencies)}")
-    for inc in inconsistencies:
-        print(f"  - {inc}")
-
     assert not is_consistent, "Should detect inconsistency (individual in both class and complement)"
     assert len(inconsistencies) > 0, "Should detect inconsistency (individual in both class and complement)"
 
     # Check that cls-com rule was triggered
     has_cls_com = any('cls-com' in str(inc) for inc in inconsistencies)
-    assert has_cls_com, "Should have inconsistency from cls-com rule"
-
-    print("✓ Test passed: Complement inconsistency detected (cls-com)")
+    assert has_cls_com, f"Should have inconsistency from cls-com rule: {inconsistencies}"
 
 
 def test_cls_maxc1():
     """Test cls-maxc1 rule (max cardinality = 0 violation)"""
-    print("\n" + "=" * 60)
-    print("TEST: Max Cardinality 0 Violation (cls-maxc1)")
-    print("=" * 60)
-
     reasoner = Reter()
 
     # Define NoChildren as ≤0 hasChild.Person (max cardinality 0)
@@ -72,28 +61,17 @@ def test_cls_maxc1():
 
     # Check for inconsistency
     is_consistent, inconsistencies = reasoner.check_consistency()
-    print(f"\nConsistent: {is_consistent}")
-    print(f"Inconsistencies detected: {len(inconsistencies)}")
-    for inc in inconsistencies:
-        print(f"  - {inc}")
-
     assert not is_consistent, "Should detect inconsistency (max cardinality 0 violated)"
     assert len(inconsistencies) > 0, "Should detect inconsistency (max cardinality 0 violated)"
 
     # Check that cls-maxc1 or cls-maxqc1 rule was triggered
     # Note: ≤0 hasChild․Person is actually qualified (has filler), so cls-maxqc1 fires
     has_cls_maxc = any('cls-maxc' in str(inc) or 'cls-maxqc' in str(inc) for inc in inconsistencies)
-    assert has_cls_maxc, "Should have inconsistency from cls-maxc1 or cls-maxqc1 rule"
-
-    print("✓ Test passed: Max cardinality 0 violation detected (cls-maxc/cls-maxqc)")
+    assert has_cls_maxc, f"Should have inconsistency from cls-maxc1 or cls-maxqc1 rule: {inconsistencies}"
 
 
 def test_cls_maxqc1():
     """Test cls-maxqc1 rule (max qualified cardinality = 0 with class)"""
-    print("\n" + "=" * 60)
-    print("TEST: Max Qualified Cardinality 0 with Class (cls-maxqc1)")
-    print("=" * 60)
-
     reasoner = Reter()
 
     # Define NoStudentFriends as ≤0 hasFriend.Student (max qualified cardinality 0)
@@ -112,27 +90,16 @@ def test_cls_maxqc1():
 
     # Check for inconsistency
     is_consistent, inconsistencies = reasoner.check_consistency()
-    print(f"\nConsistent: {is_consistent}")
-    print(f"Inconsistencies detected: {len(inconsistencies)}")
-    for inc in inconsistencies:
-        print(f"  - {inc}")
-
     assert not is_consistent, "Should detect inconsistency (max qualified cardinality 0 violated)"
     assert len(inconsistencies) > 0, "Should detect inconsistency (max qualified cardinality 0 violated)"
 
     # Check that cls-maxqc1 rule was triggered
     has_cls_maxqc1 = any('cls-maxqc1' in str(inc) for inc in inconsistencies)
-    assert has_cls_maxqc1, "Should have inconsistency from cls-maxqc1 rule"
-
-    print("✓ Test passed: Max qualified cardinality 0 violation detected (cls-maxqc1)")
+    assert has_cls_maxqc1, f"Should have inconsistency from cls-maxqc1 rule: {inconsistencies}"
 
 
 def test_cls_maxqc2():
     """Test cls-maxqc2 rule (max qualified cardinality = 0 with owl:Thing)"""
-    print("\n" + "=" * 60)
-    print("TEST: Max Qualified Cardinality 0 with owl:Thing (cls-maxqc2)")
-    print("=" * 60)
-
     reasoner = Reter()
 
     # Define Loner as ≤0 knows.⊤ (max qualified cardinality 0 on owl:Thing)
@@ -149,27 +116,16 @@ def test_cls_maxqc2():
 
     # Check for inconsistency
     is_consistent, inconsistencies = reasoner.check_consistency()
-    print(f"\nConsistent: {is_consistent}")
-    print(f"Inconsistencies detected: {len(inconsistencies)}")
-    for inc in inconsistencies:
-        print(f"  - {inc}")
-
     assert not is_consistent, "Should detect inconsistency (max qualified cardinality 0 on owl:Thing violated)"
     assert len(inconsistencies) > 0, "Should detect inconsistency (max qualified cardinality 0 on owl:Thing violated)"
 
     # Check that cls-maxqc2 rule was triggered
     has_cls_maxqc2 = any('cls-maxqc2' in str(inc) for inc in inconsistencies)
-    assert has_cls_maxqc2, "Should have inconsistency from cls-maxqc2 rule"
-
-    print("✓ Test passed: Max qualified cardinality 0 on owl:Thing violation detected (cls-maxqc2)")
+    assert has_cls_maxqc2, f"Should have inconsistency from cls-maxqc2 rule: {inconsistencies}"
 
 
 def test_cls_nothing1():
     """Test cls-nothing2 rule (instance of owl:Nothing)"""
-    print("\n" + "=" * 60)
-    print("TEST: Instance of owl:Nothing (cls-nothing2)")
-    print("=" * 60)
-
     reasoner = Reter()
 
     # Make an individual an instance of owl:Nothing (empty class)
@@ -183,19 +139,12 @@ def test_cls_nothing1():
 
     # Check for inconsistency
     is_consistent, inconsistencies = reasoner.check_consistency()
-    print(f"\nConsistent: {is_consistent}")
-    print(f"Inconsistencies detected: {len(inconsistencies)}")
-    for inc in inconsistencies:
-        print(f"  - {inc}")
-
     assert not is_consistent, "Should detect inconsistency (instance of owl:Nothing)"
     assert len(inconsistencies) > 0, "Should detect inconsistency (instance of owl:Nothing)"
 
     # Check that cls-nothing2 rule was triggered (changed from cls-nothing1)
     has_cls_nothing = any('cls-nothing2' in str(inc) for inc in inconsistencies)
-    assert has_cls_nothing, "Should have inconsistency from cls-nothing2 rule"
-
-    print("✓ Test passed: Instance of owl:Nothing detected (cls-nothing2)")
+    assert has_cls_nothing, f"Should have inconsistency from cls-nothing2 rule: {inconsistencies}"
 
 
 def test_disjoint_classes_male_female():
@@ -14,6 +14,11 @@ sys.path.insert(0, os.path.dirname(__file__))
 from reter import Reter
 
 
+# Expected result sets shared by several tests
+_JOHN_MARY = frozenset({"john", "mary"})
+_NYC_LA = frozenset({"NYC", "LA"})
+
+
 def test_values_basic():
     """Test basic VALUES constraint"""
     print("\n=== Test 1: Basic VALUES ===")
@@ -41,10 +46,10 @@ def test_values_basic():
     assert len(result_list) == 2, f"Expected 2 results, got {len(result_list)}"
 
     cities = {r["?city"] for r in result_list}
-    assert cities == {"NYC", "LA"}, f"Unexpected cities: {cities}"
+    assert cities == _NYC_LA, f"Unexpected cities: {cities}"
 
     people = {r["?x"] for r in result_list}
-    assert people == {"john", "mary"}, f"Unexpected people: {people}"
+    assert people == _JOHN_MARY, f"Unexpected people: {people}"
     assert "bob" not in people, "Bob from Chicago should not be in results"
 
     print("✓ Basic VALUES test passed")
@@ -173,7 +178,7 @@ def test_values_with_type_query():
     assert len(result_list) == 2, f"Expected 2 results, got {len(result_list)}"
 
     people = {r["?x"] for r in result_list}
-    assert people == {"john", "mary"}, f"Unexpected people: {people}"
+    assert people == _JOHN_MARY, f"Unexpected people: {people}"
     assert "bob" not in people
 
     print("✓ VALUES with type query test passed")
@@ -275,7 +280,7 @@ def test_values_select():
         assert "?x" not in r, "Did not expect ?x in results (select=[?city])"
 
     cities = {r["?city"] for r in result_list}
-    assert cities == {"NYC", "LA"}
+    assert cities == _NYC_LA
 
     print("✓ Select test passed")
 
@@ -287,12 +292,9 @@ def test_values_large_list():
     r = Reter()
 
     # Create ontology with many individuals
-    ontology = []
-    for i in range(100):
-        ontology.append(f"Person（person{i}）")
-        ontology.append(f"hasID（person{i}，{i}）")
-
-    r.load_ontology("\n".join(ontology))
+    r.load_ontology("\n".join(
+        f"Person（person{i}）\nhasID（person{i}，{i}）" for i in range(100)
+    ))
 
     # Filter for specific IDs (every 10th person)
     target_ids = [str(i) for i in range(0, 100, 10)]
@@ -348,11 +350,65 @@ def test_values_pandas():
     assert len(df) == 2
 
     cities = set(df["?city"].values)
-    assert cities == {"NYC", "LA"}
+    assert cities == _NYC_LA
 
     print("✓ Pandas test passed")
 
 
+def test_values_pattern_order():
+    """Test that reordering patterns for VALUES does not change the results"""
+    print("\n=== Test 11: Pattern reordering with VALUES ===")
+
+    r = Reter()
+    r.load_ontology("""
+        Person（john）
+        Person（mary）
+        Person（bob）
+        Person（alice）
+        livesIn（john，NYC）
+        livesIn（mary，LA）
+        livesIn（bob，Chicago）
+        livesIn（alice，NYC）
+        worksAt（john，Acme）
+        worksAt（mary，Initech）
+        worksAt（bob，Acme）
+        worksAt（alice，Globex）
+        basedIn（Acme，Boston）
+        basedIn（Initech，LA）
+        basedIn（Globex，NYC）
+    """)
+
+    # ?x joins three patterns, ?company joins two; two VALUES variables
+    patterns = (
+        ("?x", "type", "Person"),
+        ("?x", "worksAt", "?company"),
+        ("?company", "basedIn", "?hq"),
+        ("?x", "livesIn", "?city"),
+    )
+    values = {"?city": ["NYC", "LA"], "?hq": ["NYC", "LA"]}
+
+    # The VALUES query really is joined in a different order
+    ordered = Reter._order_patterns(patterns, {v: frozenset(vals) for v, vals in values.items()})
+    assert sorted(ordered) == sorted(patterns)
+    assert list(ordered) != list(patterns), "Expected the patterns to be reordered"
+
+    # Reference: the same join in the caller's order (no VALUES), filtered here
+    unordered = r.pattern(*patterns)
+    expected = sorted(
+        tuple(sorted(b.items())) for b in unordered
+        if b["?city"] in values["?city"] and b["?hq"] in values["?hq"]
+    )
+
+    results = r.pattern(*patterns, values=values)
+    actual = sorted(tuple(sorted(b.items())) for b in results)
+
+    print(f"Results: {len(actual)} bindings, expected {len(expected)}")
+    assert actual == expected, f"Reordered results differ: {actual} != {expected}"
+    assert {dict(b)["?x"] for b in actual} == {"mary", "alice"}
+
+    print("✓ Pattern reordering test passed")
+
+
 def run_all_tests():
     """Run all VALUES tests"""
     print("=" * 70)
@@ -370,6 +426,7 @@ def run_all_tests():
         test_values_select,
         test_values_large_list,
         test_values_pandas,
+        test_values_pattern_order,
     ]
 
     passed = 0
@@ -6,6 +6,9 @@ in multiple subclasses but not in their superclass, indicating
 opportunities to unify interfaces by adding these methods to the superclass.
 """
 
+import math
+
+
 # Example 1: Animal hierarchy missing common sound methods
 class Animal:
     """Base class missing make_sound() that all subclasses have."""
@@ -79,6 +82,8 @@ class Bird(Animal):
 class Shape:
     """Base shape class missing common calculation methods."""
 
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
@@ -91,6 +96,8 @@ class Shape:
 class Rectangle(Shape):
     """Rectangle with area and perimeter methods."""
 
+    __slots__ = ('width', 'height')
+
     def __init__(self, width, height):
         super().__init__("Rectangle")
         self.width = width
@@ -108,24 +115,26 @@ class Rectangle(Shape):
 class Circle(Shape):
     """Circle with area and perimeter methods."""
 
+    __slots__ = ('radius',)
+
     def __init__(self, radius):
         super().__init__("Circle")
         self.radius = radius
 
     def calculate_area(self):
         """Calculate circle area."""
-        import math
         return math.pi * self.radius ** 2
 
     def calculate_perimeter(self):
         """Calculate circle perimeter (circumference)."""
-        import math
         return 2 * math.pi * self.radius
 
 
 class Triangle(Shape):
     """Triangle with area and perimeter methods."""
 
+    __slots__ = ('base', 'height', 'sides')
+
     def __init__(self, base, height, side1, side2, side3):
         super().__init__("Triangle")
         self.base = base
@@ -356,6 +365,8 @@ class MongoDBConnector(DatabaseConnector):
 class UIComponent:
     """Base UI component missing common interface methods."""
 
+    __slots__ = ('id', 'visible')
+
     def __init__(self, id):
         self.id = id
         self.visible = True
@@ -372,6 +383,8 @@ class UIComponent:
 class Button(UIComponent):
     """Button with render and event handling."""
 
+    __slots__ = ('label',)
+
     def __init__(self, id, label):
         super().__init__(id)
         self.label = label
@@ -390,6 +403,8 @@ class Button(UIComponent):
 class TextInput(UIComponent):
     """Text input with render and event handling."""
 
+    __slots__ = ('placeholder',)
+
     def __init__(self, id, placeholder):
         super().__init__(id)
         self.placeholder = placeholder
@@ -408,6 +423,8 @@ class TextInput(UIComponent):
 class Dropdown(UIComponent):
     """Dropdown with render and event handling."""
 
+    __slots__ = ('options',)
+
     def __init__(self, id, options):
         super().__init__(id)
         self.options = options
@@ -427,6 +444,8 @@ class Dropdown(UIComponent):
 class CheckBox(UIComponent):
     """Checkbox with render and event handling."""
 
+    __slots__ = ('label',)
+
     def __init__(self, id, label):
         super().__init__(id)
         self.label = label
@@ -5,6 +5,15 @@ import pytest
 import reter_core.owl_rete_cpp as cpp
 
 
+# Scalar fact keys copied into the dicts returned by get_facts
+_FACT_KEYS = (
+    'sub', 'sup', 'individual', 'concept', 'subject',
+    'role', 'object', 'c1', 'c2', 'property',
+    'filler', 'cardinality', 'id', 'class', 'i1', 'i2',
+    'modality', 'chain', 'super_property', 'value', 'datatype',
+)
+
+
 @pytest.fixture
 def parse_cnl():
     """Fixture to parse CNL and return facts."""
@@ -21,15 +30,9 @@ def get_facts():
         result = cpp.parse_cnl(cnl_text)
         facts = []
         for f in result.facts:
-            fact_dict = {'type': f.get('type')}
-            # Add all known keys
-            for key in ['sub', 'sup', 'individual', 'concept', 'subject',
-                        'role', 'object', 'c1', 'c2', 'property',
-                        'filler', 'cardinality', 'id', 'class', 'i1', 'i2',
-                        'modality', 'chain', 'super_property', 'value', 'datatype']:
-                val = f.get(key)
-                if val:
-                    fact_dict[key] = val
+            # Type plus every known, non-empty key
+            fact_dict = {'type': f.get('type'),
+                         **{k: v for k in _FACT_KEYS if (v := f.get(k))}}
             # Handle list fields
             for key in ['classes', 'members']:
                 try:
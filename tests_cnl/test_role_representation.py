@@ -3,98 +3,91 @@
 This test verifies the morphological form of roles when stored in the fact store
 after CNL parsing.
 """
+import os
+from collections import defaultdict
+
 import pytest
 import reter_core.owl_rete_cpp as cpp
 
 
+# Exploratory fact dumps are only printed with VERBOSE=1
+_VERBOSE = bool(os.environ.get("VERBOSE"))
+
+# Fact keys copied into the dicts returned by get_facts ('type' is always kept)
+_KNOWN_KEYS = frozenset({
+    'sub', 'sup', 'individual', 'concept', 'subject',
+    'predicate', 'object', 'c1', 'c2', 'property',
+    'filler', 'cardinality', 'id', 'class', 'i1', 'i2',
+    'modality', 'chain', 'super_property', 'value', 'datatype',
+})
+
+
 def get_facts(cnl_text):
-    """Parse CNL and return list of fact dicts."""
+    """Parse CNL and return (list of fact dicts, facts indexed by type)."""
     result = cpp.parse_cnl(cnl_text)
     facts = []
+    by_type = defaultdict(list)
     for f in result.facts:
         fact_dict = {'type': f.get('type')}
-        # Add all known keys
-        for key in ['sub', 'sup', 'individual', 'concept', 'subject',
-                    'predicate', 'object', 'c1', 'c2', 'property',
-                    'filler', 'cardinality', 'id', 'class', 'i1', 'i2',
-                    'modality', 'chain', 'super_property', 'value', 'datatype']:
-            val = f.get(key)
-            if val:
-                fact_dict[key] = val
+        # Add all known, non-empty keys
+        fact_dict.update((k, v) for k, v in f.items() if k in _KNOWN_KEYS and v)
         facts.append(fact_dict)
-    return facts
+        by_type[fact_dict['type']].append(fact_dict)
+    return facts, by_type
 
 
 def print_facts(facts, title="Facts"):
-    """Pretty print facts."""
+    """Pretty print facts (only when VERBOSE is set)."""
+    if not _VERBOSE:
+        return
     print(f"\n=== {title} ===")
     for f in facts:
         print(f"  {f}")
 
 
+def print_role_facts(role_facts):
+    """Print the role-related fields of each fact (only when VERBOSE is set)."""
+    if not _VERBOSE:
+        return
+    for rf in role_facts:
+        print(f"\n  Role fact details:")
+        print(f"    subject: {rf.get('subject')}")
+        print(f"    predicate: {rf.get('predicate')}")
+        print(f"    property: {rf.get('property')}")
+        print(f"    object: {rf.get('object')}")
+
+
 class TestRoleRepresentation:
     """Test how CNL roles appear in the fact store."""
 
-    def test_hyphenated_role_instance_assertion(self):
-        """Test: 'Alfa inheres-in Beta' - how is 'inheres-in' stored?"""
-        cnl_text = "Alfa inheres-in Beta."
-        facts = get_facts(cnl_text)
+    @pytest.mark.parametrize("cnl_text", [
+        "Alfa inheres-in Beta.",    # hyphenated role
+        "John loves Mary.",         # verb role
+        "Mary is loved by John.",   # passive role
+    ], ids=["hyphenated", "verb", "passive"])
+    def test_role_instance_assertion(self, cnl_text):
+        """Test how the role in a single role assertion is stored."""
+        facts, by_type = get_facts(cnl_text)
 
-        print_facts(facts, "Role Assertion: 'Alfa inheres-in Beta'")
+        print_facts(facts, f"Role Assertion: {cnl_text!r}")
 
         # Find the role assertion fact
-        role_facts = [f for f in facts if f['type'] == 'role_assertion']
-        assert len(role_facts) > 0, f"No role_assertion found. Facts: {facts}"
-
-        # Check what the predicate/property is called
-        for rf in role_facts:
-            print(f"\n  Role fact details:")
-            print(f"    subject: {rf.get('subject')}")
-            print(f"    predicate: {rf.get('predicate')}")
-            print(f"    property: {rf.get('property')}")
-            print(f"    object: {rf.get('object')}")
-
-    def test_verb_role_instance_assertion(self):
-        """Test: 'John loves Mary' - how is 'loves' stored?"""
-        cnl_text = "John loves Mary."
-        facts = get_facts(cnl_text)
-
-        print_facts(facts, "Role Assertion: 'John loves Mary'")
-
-        role_facts = [f for f in facts if f['type'] == 'role_assertion']
+        role_facts = by_type['role_assertion']
         assert len(role_facts) > 0, f"No role_assertion found. Facts: {facts}"
 
-        for rf in role_facts:
-            print(f"\n  Role fact details:")
-            print(f"    subject: {rf.get('subject')}")
-            print(f"    predicate: {rf.get('predicate')}")
-            print(f"    property: {rf.get('property')}")
-            print(f"    object: {rf.get('object')}")
-
-    def test_passive_role_instance_assertion(self):
-        """Test: 'Mary is loved by John' - how is 'loved' stored?"""
-        cnl_text = "Mary is loved by John."
-        facts = get_facts(cnl_text)
-
-        print_facts(facts, "Role Assertion: 'Mary is loved by John'")
-
-        role_facts = [f for f in facts if f['type'] == 'role_assertion']
-        assert len(role_facts) > 0, f"No role_assertion found. Facts: {facts}"
-
-        for rf in role_facts:
-            print(f"\n  Role fact details:")
-            print(f"    subject: {rf.get('subject')}")
-            print(f"    predicate: {rf.get('predicate')}")
-            print(f"    property: {rf.get('property')}")
-            print(f"    object: {rf.get('object')}")
+        # Show what the predicate/property is called
+        print_role_facts(role_facts)
 
     def test_role_in_subsumption(self):
         """Test: 'Every person loves a thing' - how is 'loves' stored in restriction?"""
         cnl_text = "Every person loves a thing."
-        facts = get_facts(cnl_text)
+        facts, _ = get_facts(cnl_text)
 
         print_facts(facts, "Subsumption: 'Every person loves a thing'")
 
+        if not _VERBOSE:
+            return
+
         # This creates existential restriction facts
         for f in facts:
             if 'property' in f or 'predicate' in f:
@@ -103,16 +96,19 @@ class TestRoleRepresentation:
     def test_compare_active_passive(self):
         """Test that active and passive forms produce the same role."""
         # Active voice
-        facts1 = get_facts("John owns Pussy.")
+        facts1, by_type1 = get_facts("John owns Pussy.")
         print_facts(facts1, "Active: 'John owns Pussy'")
 
         # Passive voice
-        facts2 = get_facts("Pussy is owned by John.")
+        facts2, by_type2 = get_facts("Pussy is owned by John.")
         print_facts(facts2, "Passive: 'Pussy is owned by John'")
 
         # Extract role names
-        role1 = [f for f in facts1 if f['type'] == 'role_assertion']
-        role2 = [f for f in facts2 if f['type'] == 'role_assertion']
+        role1 = by_type1['role_assertion']
+        role2 = by_type2['role_assertion']
+
+        if not _VERBOSE:
+            return
 
         print(f"\nActive role facts: {role1}")
         print(f"Passive role facts: {role2}")
@@ -132,19 +128,20 @@ class TestRoleRepresentation:
         Peter loves Susan.
         Alice hates Bob.
         """
-        facts = get_facts(cnl_text)
+        facts, by_type = get_facts(cnl_text)
 
         print_facts(facts, "Multiple Role Assertions")
 
-        role_facts = [f for f in facts if f['type'] == 'role_assertion']
+        if not _VERBOSE:
+            return
+
+        role_facts = by_type['role_assertion']
         print(f"\nFound {len(role_facts)} role assertions")
 
         # Group by predicate/property
-        by_role = {}
+        by_role = defaultdict(list)
         for rf in role_facts:
             role_name = rf.get('predicate') or rf.get('property') or 'unknown'
-            if role_name not in by_role:
-                by_role[role_name] = []
             by_role[role_name].append(rf)
 
         print(f"\nGrouped by role name:")